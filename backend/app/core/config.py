@@ -3,16 +3,124 @@ Application configuration
 """
 
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Literal, Optional
 
 class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./osint_tool.db"
     SECRET_KEY: str = "dev-secret-key-change-in-production-use-env-var"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
-    
+
+    # Password hashing (bcrypt cost factor and hashing thread pool size)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 4
+
+    # Authentication caches (verified tokens, user lookups by token subject)
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_SIZE: int = 10000
+    AUTH_USER_CACHE_TTL: int = 30
+
+    # Async database engine. Pool settings apply to PostgreSQL (asyncpg);
+    # SQLite (aiosqlite) uses SQLAlchemy's default pool.
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_ECHO: bool = False
+    # Expand pre-existing OSINTQuery.results blobs into the findings table
+    FINDINGS_BACKFILL_ON_STARTUP: bool = True
+    # Index entities of queries saved before the entity index existed
+    ENTITY_INDEX_BACKFILL_ON_STARTUP: bool = True
+    # Build sorted timelines for queries saved before timelines were stored
+    TIMELINE_BACKFILL_ON_STARTUP: bool = True
+
+    # Shared outbound HTTP client (connection pool used by all modules)
+    HTTP_TIMEOUT: float = 10.0
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_MAX_CONNECTIONS_PER_HOST: int = 10
+    HTTP2_ENABLED: bool = True
+    HTTP_USER_AGENT: str = "OSINT-Tool-Educational"
+
+    # WHOIS / DNS lookups
+    DNS_TIMEOUT: float = 5.0
+    WHOIS_TIMEOUT: float = 10.0
+    WHOIS_MAX_WORKERS: int = 4
+
+    # Social media username probing. SOCIAL_PLATFORMS_FILE overrides the
+    # bundled registry (app/services/modules/data/social_platforms.json).
+    SOCIAL_PLATFORMS_FILE: Optional[str] = None
+    SOCIAL_MEDIA_MAX_CONCURRENCY: int = 50
+    SOCIAL_MEDIA_TIMEOUT: float = 5.0
+
+    # OSINT engine time budget (seconds). Per-module timeouts fall back to
+    # OSINT_MODULE_TIMEOUT; the query deadline cancels anything still running.
+    OSINT_QUERY_DEADLINE: float = 30.0
+    OSINT_MODULE_TIMEOUT: float = 20.0
+    OSINT_MODULE_TIMEOUTS: Dict[str, float] = {
+        "social": 25.0,
+        "whois_dns": 15.0,
+    }
+    OSINT_DISABLED_MODULES: List[str] = []
+    # Concurrent analyses of the same indicator share one execution
+    OSINT_COALESCE_QUERIES: bool = True
+    # Post-collection filtering: simulated placeholder results are dropped
+    # ("drop") or kept but marked and left out of analysis ("flag")
+    OSINT_PLACEHOLDER_POLICY: Literal["drop", "flag"] = "drop"
+    OSINT_DROP_LOW_SIGNAL: bool = True
+
+    # Background OSINT jobs
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_MAX_SIZE: int = 1000
+    JOB_RETENTION_SECONDS: int = 3600
+
+    # Bulk indicator submission
+    BULK_MAX_INDICATORS: int = 10000
+    BULK_MAX_CONCURRENCY: int = 8
+
+    # Module result cache. TTLs are in seconds and keyed by engine module
+    # name; empty (negative) results use RESULT_CACHE_NEGATIVE_TTL.
+    RESULT_CACHE_ENABLED: bool = True
+    RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    RESULT_CACHE_DEFAULT_TTL: int = 3600
+    RESULT_CACHE_NEGATIVE_TTL: int = 600
+    RESULT_CACHE_TTLS: Dict[str, int] = {
+        "search": 3600,
+        "social": 6 * 3600,
+        "whois_dns": 24 * 3600,
+        "breach": 24 * 3600,
+        "github": 3600,
+        "paste": 3600,
+        "news": 1800,
+    }
+    RESULT_CACHE_SQLITE_PATH: Optional[str] = None
+
+    # Generated report files, keyed by report inputs and evicted by size. The
+    # size bound is tracked per process: with several workers sharing the
+    # directory, each counts only what it found at startup or wrote itself
+    REPORT_CACHE_DIR: str = "./report_cache"
+    REPORT_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+    # Temp files older than this (seconds) are leftovers of dead renders
+    REPORT_CACHE_STALE_TEMP_AGE: int = 3600
+
+    # PDF rendering process pool; renders past the worker count queue up to
+    # PDF_RENDER_MAX_QUEUED before requests are refused with 503
+    PDF_RENDER_WORKERS: int = 2
+    PDF_RENDER_MAX_QUEUED: int = 16
+
+    # Per-host token-bucket rate limits (requests/second and burst size).
+    # "whois" is a pseudo-host covering all registrar lookups.
+    RATE_LIMIT_DEFAULT_RATE: float = 5.0
+    RATE_LIMIT_DEFAULT_BURST: int = 10
+    RATE_LIMIT_HOSTS: Dict[str, Dict[str, float]] = {
+        "api.duckduckgo.com": {"rate": 1.0, "burst": 5},
+        "api.github.com": {"rate": 0.5, "burst": 10},
+        "haveibeenpwned.com": {"rate": 0.16, "burst": 1},
+        "whois": {"rate": 1.0, "burst": 5},
+    }
+
     class Config:
         env_file = ".env"
 
 settings = Settings()
-
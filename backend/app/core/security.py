@@ -2,27 +2,117 @@
 Security utilities for authentication
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.config import settings
+from app.core.ttl_cache import TTLCache
 from app.database import get_db
 from app.models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Pinning min/max to the configured cost makes hashes made at any other
+# cost "need update", so they are transparently rehashed on next login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS
+)
 security = HTTPBearer()
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+@dataclass(frozen=True)
+class AuthenticatedUser:
+    """Detached snapshot of the user behind a request's token"""
+    id: int
+    username: str
+    email: str
+    is_active: bool
+    created_at: Optional[datetime]
 
-def get_password_hash(password: str) -> str:
-    """Hash a password"""
-    return pwd_context.hash(password)
+    @classmethod
+    def from_model(cls, user: User) -> "AuthenticatedUser":
+        return cls(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            is_active=user.is_active,
+            created_at=user.created_at
+        )
+
+# Verified JWT payloads, kept until the token expires
+_token_cache = TTLCache(
+    maxsize=settings.AUTH_TOKEN_CACHE_SIZE,
+    ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+# Token subject -> user snapshot; short TTL bounds staleness across workers
+_user_cache = TTLCache(
+    maxsize=settings.AUTH_USER_CACHE_SIZE,
+    ttl=settings.AUTH_USER_CACHE_TTL
+)
+
+def invalidate_user_cache(username: Optional[str] = None) -> None:
+    """Drop one cached user (or all of them)"""
+    if username is None:
+        _user_cache.clear()
+    else:
+        _user_cache.pop(username)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _on_user_changed(mapper, connection, target: User) -> None:
+    # ORM flushes only; bulk UPDATE statements must call invalidate_user_cache
+    invalidate_user_cache(target.username)
+    for old_username in inspect(target).attrs.username.history.deleted:
+        invalidate_user_cache(old_username)
+
+def _decode_token(token: str) -> Dict[str, Any]:
+    """Verify a JWT, memoized per token until it expires"""
+    payload = _token_cache.get(token)
+    if payload is None:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        _token_cache.set(token, payload, expires_at=payload.get("exp"))
+    return payload
+
+# bcrypt is CPU-bound but releases the GIL, so it runs on a small thread pool.
+# The semaphore keeps excess work waiting on the loop (cheap, cancellable)
+# rather than piling up in the executor's unbounded queue.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+_hash_slots: Optional[asyncio.Semaphore] = None
+
+async def _run_hashing(func, *args):
+    global _hash_slots
+    if _hash_slots is None:
+        _hash_slots = asyncio.Semaphore(settings.PASSWORD_HASH_WORKERS)
+    async with _hash_slots:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, func, *args)
+
+async def hash_password(password: str) -> str:
+    """Hash a password off the event loop"""
+    return await _run_hashing(pwd_context.hash, password)
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password off the event loop.
+    Returns (valid, new_hash); new_hash is set when the stored hash was made
+    with an outdated cost and should be replaced.
+    """
+    return await _run_hashing(pwd_context.verify_and_update, plain_password, hashed_password)
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
@@ -37,8 +127,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
+    db: AsyncSession = Depends(get_db)
+) -> AuthenticatedUser:
     """Get current authenticated user"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -48,16 +138,25 @@ async def get_current_user(
     
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = _decode_token(token)
         username: str = payload.get("sub")
         if username is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.username == username).first()
+    user = _user_cache.get(username)
     if user is None:
-        raise credentials_exception
+        db_user = await db.scalar(select(User).where(User.username == username))
+        if db_user is None:
+            raise credentials_exception
+        user = AuthenticatedUser.from_model(db_user)
+        _user_cache.set(username, user)
+    
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
     
     return user
-
@@ -2,25 +2,73 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+def _async_database_url(url: str) -> str:
+    """Map plain DATABASE_URLs onto their async drivers (aiosqlite / asyncpg)"""
+    if url.startswith("sqlite://"):
+        return "sqlite+aiosqlite://" + url[len("sqlite://"):]
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    if url.startswith("postgres://"):
+        return "postgresql+asyncpg://" + url[len("postgres://"):]
+    return url
+
+ASYNC_DATABASE_URL = _async_database_url(settings.DATABASE_URL)
+
 # Use SQLite for quick start, PostgreSQL for production
-if settings.DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+if ASYNC_DATABASE_URL.startswith("sqlite"):
+    engine = create_async_engine(ASYNC_DATABASE_URL, echo=settings.DB_ECHO)
 else:
-    engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        echo=settings.DB_ECHO,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+# Objects stay usable after commit without a refresh round-trip
+SessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
 
 Base = declarative_base()
 
-def get_db():
+def _add_missing_columns(connection) -> None:
+    """
+    Add nullable columns declared since a table was created. Anything else
+    (constraints, type changes) still needs a real migration.
+    """
+    inspector = inspect(connection)
+    preparer = connection.dialect.identifier_preparer
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing or not column.nullable or column.server_default is not None:
+                continue
+            column_type = column.type.compile(dialect=connection.dialect)
+            connection.execute(text(
+                f"ALTER TABLE {preparer.format_table(table)} "
+                f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+            ))
+
+def _create_missing_indexes(connection) -> None:
+    """create_all skips tables that already exist, indexes added to them included"""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+async def init_db():
+    """Create database tables, and columns and indexes added since a table was created"""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_add_missing_columns)
+        await conn.run_sync(_create_missing_indexes)
+
+async def get_db():
     """Dependency for getting database session"""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
-
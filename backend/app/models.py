@@ -2,7 +2,8 @@
 Database models
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Text, JSON, Boolean, ForeignKey, Float
+from datetime import datetime, timezone
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, Text, JSON, Boolean, ForeignKey, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -31,9 +32,20 @@ class OSINTQuery(Base):
     results = Column(JSON)
     risk_score = Column(String)  # LOW, MEDIUM, HIGH
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Set on every edit (e.g. re-correlation); part of the case report key, so
+    # stamped in Python to keep sub-second precision on SQLite
+    updated_at = Column(DateTime(timezone=True), onupdate=lambda: datetime.now(timezone.utc))
     
     user = relationship("User", back_populates="queries")
     case = relationship("Case", back_populates="queries")
+    findings = relationship("Finding", back_populates="query", passive_deletes=True)
+    
+    __table_args__ = (
+        # Keyset pagination of a user's history, newest first
+        Index("ix_osint_queries_user_created_id", "user_id", "created_at", "id"),
+        # Covers the per-case aggregates (count, risk split, last activity)
+        Index("ix_osint_queries_case_risk_created", "case_id", "risk_score", "created_at"),
+    )
 
 class Case(Base):
     __tablename__ = "cases"
@@ -47,5 +59,80 @@ class Case(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     user = relationship("User", back_populates="cases")
-    queries = relationship("OSINTQuery", back_populates="case")
+    # Queries are detached explicitly on delete (see cases router), so the
+    # collection never needs loading through the async session
+    queries = relationship("OSINTQuery", back_populates="case", passive_deletes=True)
+
+
+class Finding(Base):
+    """One result of a query, normalized out of OSINTQuery.results for filtering"""
+    __tablename__ = "findings"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    query_id = Column(Integer, ForeignKey("osint_queries.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Denormalized from the query so case/user filters need no join
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    case_id = Column(Integer, ForeignKey("cases.id"), nullable=True)
+    source = Column(String, nullable=False, index=True)
+    confidence = Column(String, index=True)  # HIGH, MEDIUM, LOW
+    timestamp = Column(DateTime, index=True)
+    url = Column(String)
+    # Extracted entities
+    username = Column(String, index=True)
+    email = Column(String, index=True)
+    domain = Column(String, index=True)
+    data = Column(JSON)
+    
+    query = relationship("OSINTQuery", back_populates="findings")
+    
+    __table_args__ = (
+        Index("ix_findings_case_source_confidence", "case_id", "source", "confidence"),
+        Index("ix_findings_user_source_confidence", "user_id", "source", "confidence"),
+    )
+
+
+class BackfillMarker(Base):
+    """Completed one-off data backfill, so startup does not repeat it"""
+    __tablename__ = "backfill_markers"
+    
+    name = Column(String, primary_key=True)
+    completed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class EntityOccurrence(Base):
+    """Inverted index entry: a normalized entity seen in a query's results"""
+    __tablename__ = "entity_occurrences"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    entity_type = Column(String, nullable=False)  # username, email, domain, ip, url
+    value = Column(String, nullable=False)
+    query_id = Column(Integer, ForeignKey("osint_queries.id", ondelete="CASCADE"), nullable=False, index=True)
+    # Null when the entity is the query's own indicator
+    finding_id = Column(Integer, ForeignKey("findings.id", ondelete="CASCADE"), nullable=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    source = Column(String, nullable=False)
+    
+    __table_args__ = (
+        # Pivot lookups: every occurrence of one entity for one user
+        Index("ix_entity_occurrences_user_entity", "user_id", "entity_type", "value"),
+    )
+
+
+class QueryTimeline(Base):
+    """A query's timeline events, parsed once at ingest and stored sorted"""
+    __tablename__ = "query_timelines"
+    
+    query_id = Column(Integer, ForeignKey("osint_queries.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    case_id = Column(Integer, ForeignKey("cases.id"), nullable=True)
+    # Bounds of the events, in epoch milliseconds (null when there are none)
+    first_ts = Column(BigInteger)
+    last_ts = Column(BigInteger)
+    # [[epoch_ms, source, event, finding_id], ...] ordered by epoch_ms
+    events = Column(JSON, nullable=False)
+    
+    __table_args__ = (
+        # Case timeline windows: queries of a case overlapping [start, end]
+        Index("ix_query_timelines_case_first_last", "case_id", "first_ts", "last_ts"),
+    )
 
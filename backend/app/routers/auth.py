@@ -3,26 +3,27 @@ Authentication routes
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from app.database import get_db
 from app.models import User
 from app.schemas import UserCreate, UserResponse, Token
 from app.core.security import (
-    verify_password, get_password_hash, create_access_token,
-    get_current_user
+    hash_password, verify_and_update_password, create_access_token,
+    get_current_user, AuthenticatedUser
 )
 from app.core.config import settings
 
 router = APIRouter()
 
 @router.post("/register", response_model=UserResponse)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a new user"""
     # Check if user exists
-    db_user = db.query(User).filter(
+    db_user = await db.scalar(select(User).where(
         (User.username == user_data.username) | (User.email == user_data.email)
-    ).first()
+    ))
     if db_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -30,29 +31,37 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # Create new user
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password(user_data.password)
     db_user = User(
         username=user_data.username,
         email=user_data.email,
         hashed_password=hashed_password
     )
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     
     return db_user
 
 @router.post("/login", response_model=Token)
-async def login(user_data: UserCreate, db: Session = Depends(get_db)):
+async def login(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """Login and get access token"""
-    user = db.query(User).filter(User.username == user_data.username).first()
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.username == user_data.username))
+    valid, new_hash = False, None
+    if user:
+        valid, new_hash = await verify_and_update_password(user_data.password, user.hashed_password)
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # Stored hash predates the current BCRYPT_ROUNDS: upgrade it in place
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+    
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -67,7 +76,7 @@ async def login(user_data: UserCreate, db: Session = Depends(get_db)):
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_user)):
+async def get_current_user_info(current_user: AuthenticatedUser = Depends(get_current_user)):
     """Get current user information"""
     return current_user
 
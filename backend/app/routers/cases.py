@@ -2,21 +2,25 @@
 Case management routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import case as sql_case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from app.database import get_db
-from app.models import User, Case
-from app.schemas import CaseCreate, CaseResponse
-from app.core.security import get_current_user
+from app.models import Case, OSINTQuery, Finding, QueryTimeline
+from app.schemas import CaseCreate, CaseResponse, CaseSummary, CaseTimelinePage
+from app.core.security import get_current_user, AuthenticatedUser
+from app.services.pagination import decode_token, encode_token, InvalidCursor
+from app.services.timelines import case_timeline
 
 router = APIRouter()
 
 @router.post("/", response_model=CaseResponse)
 async def create_case(
     case: CaseCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Create a new investigation case"""
     db_case = Case(
@@ -25,34 +29,89 @@ async def create_case(
         description=case.description
     )
     db.add(db_case)
-    db.commit()
-    db.refresh(db_case)
+    await db.commit()
+    await db.refresh(db_case)
     
     return db_case
 
 @router.get("/", response_model=List[CaseResponse])
 async def get_cases(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get all cases for current user"""
-    cases = db.query(Case).filter(
-        Case.user_id == current_user.id
-    ).order_by(Case.created_at.desc()).all()
+    cases = (await db.scalars(
+        select(Case).where(
+            Case.user_id == current_user.id
+        ).order_by(Case.created_at.desc())
+    )).all()
     
     return cases
 
+RISK_LEVELS = ("LOW", "MEDIUM", "HIGH")
+
+@router.get("/summary", response_model=List[CaseSummary])
+async def get_case_summaries(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    All cases for current user with query counts, risk distribution and
+    last activity, aggregated in one grouped pass over the case indexes
+    """
+    query_stats = select(
+        OSINTQuery.case_id.label("case_id"),
+        func.count(OSINTQuery.id).label("query_count"),
+        func.max(OSINTQuery.created_at).label("last_activity"),
+        *(
+            func.sum(sql_case((OSINTQuery.risk_score == level, 1), else_=0)).label(level)
+            for level in RISK_LEVELS
+        )
+    ).where(
+        OSINTQuery.user_id == current_user.id,
+        OSINTQuery.case_id.is_not(None)
+    ).group_by(OSINTQuery.case_id).subquery()
+    
+    finding_stats = select(
+        Finding.case_id.label("case_id"),
+        func.count(Finding.id).label("finding_count")
+    ).where(
+        Finding.user_id == current_user.id,
+        Finding.case_id.is_not(None)
+    ).group_by(Finding.case_id).subquery()
+    
+    rows = (await db.execute(
+        select(Case, query_stats, finding_stats.c.finding_count).outerjoin(
+            query_stats, query_stats.c.case_id == Case.id
+        ).outerjoin(
+            finding_stats, finding_stats.c.case_id == Case.id
+        ).where(
+            Case.user_id == current_user.id
+        ).order_by(Case.created_at.desc())
+    )).all()
+    
+    summaries = []
+    for row in rows:
+        summary = CaseSummary.model_validate(row.Case)
+        summary.query_count = row.query_count or 0
+        summary.finding_count = row.finding_count or 0
+        summary.risk_counts = {level: getattr(row, level) or 0 for level in RISK_LEVELS}
+        summary.last_activity = row.last_activity or row.Case.updated_at or row.Case.created_at
+        summaries.append(summary)
+    
+    return summaries
+
 @router.get("/{case_id}", response_model=CaseResponse)
 async def get_case(
     case_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific case"""
-    case = db.query(Case).filter(
+    case = await db.scalar(select(Case).where(
         Case.id == case_id,
         Case.user_id == current_user.id
-    ).first()
+    ))
     
     if not case:
         raise HTTPException(
@@ -62,18 +121,56 @@ async def get_case(
     
     return case
 
+@router.get("/{case_id}/timeline", response_model=CaseTimelinePage)
+async def get_case_timeline(
+    case_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Events from every query in a case, oldest first, optionally limited to
+    [start, end]. Pass the returned next_cursor to fetch the following page.
+    """
+    case = await db.scalar(select(Case.id).where(
+        Case.id == case_id,
+        Case.user_id == current_user.id
+    ))
+    
+    if not case:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found"
+        )
+    
+    after = None
+    if cursor:
+        try:
+            after = tuple(decode_token(cursor))
+            if len(after) != 3 or not all(isinstance(part, int) for part in after):
+                raise InvalidCursor("Invalid cursor")
+        except InvalidCursor as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    items, next_key = await case_timeline(db, case_id, current_user.id, start, end, after, limit)
+    next_cursor = encode_token(list(next_key)) if next_key else None
+    return CaseTimelinePage(items=items, next_cursor=next_cursor)
+
 @router.put("/{case_id}", response_model=CaseResponse)
 async def update_case(
     case_id: int,
     case_update: CaseCreate,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Update a case"""
-    case = db.query(Case).filter(
+    case = await db.scalar(select(Case).where(
         Case.id == case_id,
         Case.user_id == current_user.id
-    ).first()
+    ))
     
     if not case:
         raise HTTPException(
@@ -83,22 +180,22 @@ async def update_case(
     
     case.name = case_update.name
     case.description = case_update.description
-    db.commit()
-    db.refresh(case)
+    await db.commit()
+    await db.refresh(case)
     
     return case
 
 @router.delete("/{case_id}")
 async def delete_case(
     case_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Delete a case"""
-    case = db.query(Case).filter(
+    case = await db.scalar(select(Case).where(
         Case.id == case_id,
         Case.user_id == current_user.id
-    ).first()
+    ))
     
     if not case:
         raise HTTPException(
@@ -106,8 +203,18 @@ async def delete_case(
             detail="Case not found"
         )
     
-    db.delete(case)
-    db.commit()
+    # Keep the case's queries, just detach them
+    await db.execute(
+        update(OSINTQuery).where(OSINTQuery.case_id == case.id).values(case_id=None)
+    )
+    await db.execute(
+        update(Finding).where(Finding.case_id == case.id).values(case_id=None)
+    )
+    await db.execute(
+        update(QueryTimeline).where(QueryTimeline.case_id == case.id).values(case_id=None)
+    )
+    await db.delete(case)
+    await db.commit()
     
     return {"message": "Case deleted successfully"}
 
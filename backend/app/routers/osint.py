@@ -2,76 +2,298 @@
 OSINT query routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, File, Form, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, List, Optional
+import json
 from app.database import get_db
-from app.models import User, OSINTQuery
-from app.schemas import OSINTQueryRequest, OSINTQueryResponse
-from app.core.security import get_current_user
-from app.services.osint_engine import osint_engine
+from app.models import OSINTQuery, Case, Finding
+from app.schemas import (
+    OSINTQueryRequest, OSINTQueryResponse, OSINTQuerySummary, OSINTQueryPage,
+    OSINTJobResponse, FindingResponse, PivotHit
+)
+from app.core.config import settings
+from app.core.security import get_current_user, AuthenticatedUser
+from app.services.osint_engine import osint_engine, QUERY_TYPES
+from app.services.result_cache import result_cache
+from app.services.query_store import save_query
+from app.services.job_queue import job_queue, JobQueueFull, JOB_COMPLETED, JOB_FAILED
+from app.services.bulk import parse_indicators, run_bulk, BulkInputError
+from app.services.pagination import before_cursor, encode_cursor, InvalidCursor
+from app.services.correlation import recorrelate, ENTITY_TYPES
+from app.services.entity_index import pivot, rebuild_entity_index
 
 router = APIRouter()
 
+def _validate_query_type(query_type: str) -> None:
+    if query_type not in QUERY_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid query type. Must be one of: {', '.join(QUERY_TYPES)}"
+        )
+
+async def _check_case_owner(db: AsyncSession, case_id: Optional[int], user_id: int) -> None:
+    """404 unless `case_id` is empty or one of the user's own cases"""
+    if case_id is None:
+        return
+    case = await db.scalar(select(Case.id).where(
+        Case.id == case_id,
+        Case.user_id == user_id
+    ))
+    if not case:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found"
+        )
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
 @router.post("/query", response_model=OSINTQueryResponse)
 async def create_osint_query(
     query: OSINTQueryRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Perform OSINT analysis on a query"""
-    
-    # Validate query type
-    valid_types = ["username", "email", "phone", "domain", "ip", "company"]
-    if query.query_type not in valid_types:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid query type. Must be one of: {', '.join(valid_types)}"
-        )
+    _validate_query_type(query.query_type)
+    await _check_case_owner(db, query.case_id, current_user.id)
     
     # Run OSINT analysis
     analysis_result = await osint_engine.analyze(query.query_type, query.query_value)
     
     # Save query to database
-    db_query = OSINTQuery(
-        user_id=current_user.id,
-        query_type=query.query_type,
-        query_value=query.query_value,
-        results=analysis_result,
-        risk_score=analysis_result.get("risk_score", "LOW"),
-        case_id=query.case_id
+    return await save_query(
+        db, current_user.id, query.query_type, query.query_value,
+        analysis_result, case_id=query.case_id
     )
-    db.add(db_query)
-    db.commit()
-    db.refresh(db_query)
+
+@router.post("/query/stream")
+async def stream_osint_query(
+    query: OSINTQueryRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Perform OSINT analysis, streaming findings as server-sent events.
+    Emits one "module" event per finished module, then a final "analysis"
+    event carrying the saved query id and the correlated analysis.
+    """
+    _validate_query_type(query.query_type)
+    await _check_case_owner(db, query.case_id, current_user.id)
+    user_id = current_user.id
+    
+    async def event_stream():
+        async for event in osint_engine.analyze_stream(query.query_type, query.query_value):
+            if event["event"] == "module":
+                yield _sse("module", {key: value for key, value in event.items() if key != "event"})
+                continue
+            
+            analysis_result = event["result"]
+            db_query = await save_query(
+                db, user_id, query.query_type, query.query_value,
+                analysis_result, case_id=query.case_id
+            )
+            yield _sse("analysis", {
+                "query_id": db_query.id,
+                "analysis": analysis_result["analysis"],
+                "modules": analysis_result["modules"],
+                "risk_score": analysis_result["risk_score"],
+                "timestamp": analysis_result["timestamp"]
+            })
     
-    return db_query
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.post("/bulk")
+async def submit_bulk_query(
+    file: UploadFile = File(...),
+    case_id: Optional[int] = Form(None),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Analyze an NDJSON or CSV upload of (query_type, query_value) pairs.
+    Indicators are deduplicated and run under a global concurrency cap;
+    progress is streamed back as NDJSON, one line per finished indicator
+    followed by a summary line.
+    """
+    await _check_case_owner(db, case_id, current_user.id)
+    
+    try:
+        indicators, counts = parse_indicators(await file.read(), file.filename or "")
+    except BulkInputError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    user_id = current_user.id
+    
+    async def ndjson_stream():
+        async for record in run_bulk(indicators, user_id, case_id=case_id):
+            if record["event"] == "summary":
+                record.update(counts)
+            yield json.dumps(record, default=str) + "\n"
+    
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+@router.post("/jobs", response_model=OSINTJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def submit_osint_job(
+    query: OSINTQueryRequest,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Queue an OSINT analysis and return its job id immediately"""
+    _validate_query_type(query.query_type)
+    await _check_case_owner(db, query.case_id, current_user.id)
+    
+    try:
+        job = job_queue.submit(
+            current_user.id, query.query_type, query.query_value, case_id=query.case_id
+        )
+    except JobQueueFull:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Job queue is full, retry later",
+            headers={"Retry-After": "5"}
+        )
+    
+    return job
+
+def _get_job_or_404(job_id: str, user_id: int):
+    job = job_queue.get(job_id, user_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job
+
+@router.get("/jobs/{job_id}", response_model=OSINTJobResponse)
+async def get_osint_job(
+    job_id: str,
+    current_user: AuthenticatedUser = Depends(get_current_user)
+):
+    """Get status and progress of a queued OSINT analysis"""
+    return _get_job_or_404(job_id, current_user.id)
+
+@router.get("/jobs/{job_id}/result", response_model=OSINTQueryResponse)
+async def get_osint_job_result(
+    job_id: str,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the saved query produced by a completed job"""
+    job = _get_job_or_404(job_id, current_user.id)
+    
+    if job.status == JOB_FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Job failed: {job.error}"
+        )
+    if job.status != JOB_COMPLETED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Job is {job.status}"
+        )
+    
+    return await db.scalar(select(OSINTQuery).where(
+        OSINTQuery.id == job.query_id,
+        OSINTQuery.user_id == current_user.id
+    ))
 
 @router.get("/queries", response_model=List[OSINTQueryResponse])
 async def get_user_queries(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
     skip: int = 0,
     limit: int = 50
 ):
     """Get user's OSINT query history"""
-    queries = db.query(OSINTQuery).filter(
-        OSINTQuery.user_id == current_user.id
-    ).order_by(OSINTQuery.created_at.desc()).offset(skip).limit(limit).all()
+    queries = (await db.scalars(
+        select(OSINTQuery).where(
+            OSINTQuery.user_id == current_user.id
+        ).order_by(OSINTQuery.created_at.desc()).offset(skip).limit(limit)
+    )).all()
     
     return queries
 
+@router.get("/queries/summary", response_model=OSINTQueryPage)
+async def get_user_query_summaries(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=200)
+):
+    """
+    Page through the user's query history, newest first, without loading
+    result blobs. Pass the returned next_cursor to fetch the following page.
+    """
+    conditions = [OSINTQuery.user_id == current_user.id]
+    try:
+        after = before_cursor(db, OSINTQuery.created_at, OSINTQuery.id, cursor)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if after is not None:
+        conditions.append(after)
+    
+    rows = (await db.execute(
+        select(
+            OSINTQuery.id,
+            OSINTQuery.query_type,
+            OSINTQuery.query_value,
+            OSINTQuery.risk_score,
+            OSINTQuery.case_id,
+            OSINTQuery.created_at
+        ).where(*conditions).order_by(
+            OSINTQuery.created_at.desc(), OSINTQuery.id.desc()
+        ).limit(limit + 1)
+    )).all()
+    
+    items = [OSINTQuerySummary.model_validate(row) for row in rows[:limit]]
+    next_cursor = None
+    if len(rows) > limit:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return OSINTQueryPage(items=items, next_cursor=next_cursor)
+
 @router.get("/queries/{query_id}", response_model=OSINTQueryResponse)
 async def get_query(
     query_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a specific OSINT query"""
-    query = db.query(OSINTQuery).filter(
+    query = await db.scalar(select(OSINTQuery).where(
+        OSINTQuery.id == query_id,
+        OSINTQuery.user_id == current_user.id
+    ))
+    
+    if not query:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Query not found"
+        )
+    
+    return query
+
+@router.post("/queries/{query_id}/correlate", response_model=OSINTQueryResponse)
+async def recorrelate_query(
+    query_id: int,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Recompute the analysis of a stored query with the current correlation rules"""
+    query = await db.scalar(select(OSINTQuery).where(
         OSINTQuery.id == query_id,
         OSINTQuery.user_id == current_user.id
-    ).first()
+    ))
     
     if not query:
         raise HTTPException(
@@ -79,5 +301,91 @@ async def get_query(
             detail="Query not found"
         )
     
+    # Assign a new dict so the JSON column is flagged as changed
+    query.results = recorrelate(dict(query.results or {}))
+    query.risk_score = query.results["risk_score"]
+    await db.commit()
+    await db.refresh(query)
+    
     return query
 
+
+@router.get("/pivot", response_model=List[PivotHit])
+async def pivot_entity(
+    value: str,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    entity_type: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500)
+):
+    """Past queries whose results mentioned an email, username, domain, IP or URL"""
+    if entity_type is not None and entity_type not in ENTITY_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid entity type. Must be one of: {', '.join(ENTITY_TYPES)}"
+        )
+    
+    return await pivot(db, current_user.id, value, entity_type=entity_type, limit=limit)
+
+@router.post("/entities/rebuild")
+async def rebuild_entities(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Rebuild the entity index for all of the current user's queries"""
+    processed = await rebuild_entity_index(db, user_id=current_user.id)
+    return {"queries_indexed": processed}
+
+
+@router.get("/findings", response_model=List[FindingResponse])
+async def get_findings(
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    case_id: Optional[int] = None,
+    query_id: Optional[int] = None,
+    source: Optional[str] = None,
+    confidence: Optional[str] = None,
+    entity: Optional[str] = Query(None, description="Username, email or domain"),
+    skip: int = 0,
+    limit: int = Query(100, le=1000)
+):
+    """Filter stored findings using the indexed findings table"""
+    stmt = select(Finding).where(Finding.user_id == current_user.id)
+    if case_id is not None:
+        stmt = stmt.where(Finding.case_id == case_id)
+    if query_id is not None:
+        stmt = stmt.where(Finding.query_id == query_id)
+    if source:
+        stmt = stmt.where(Finding.source == source)
+    if confidence:
+        stmt = stmt.where(Finding.confidence == confidence.upper())
+    if entity:
+        value = entity.strip().lower()
+        stmt = stmt.where(
+            (Finding.username == value) | (Finding.email == value) | (Finding.domain == value)
+        )
+    
+    findings = (await db.scalars(
+        stmt.order_by(Finding.id.desc()).offset(skip).limit(limit)
+    )).all()
+    
+    return findings
+
+@router.get("/modules")
+async def get_modules(current_user: AuthenticatedUser = Depends(get_current_user)):
+    """List registered modules with the query types they handle and whether they can run"""
+    loaded = set(osint_engine.registry.loaded())
+    return [
+        {
+            **spec.as_dict(),
+            "enabled": spec.name not in settings.OSINT_DISABLED_MODULES,
+            "missing_dependencies": spec.missing_dependencies(),
+            "loaded": spec.name in loaded
+        }
+        for spec in osint_engine.registry.specs()
+    ]
+
+@router.get("/cache/stats")
+async def get_cache_stats(current_user: AuthenticatedUser = Depends(get_current_user)):
+    """Get module result cache hit/miss counters"""
+    return result_cache.stats()
@@ -2,28 +2,83 @@
 Report generation routes
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Response
-from sqlalchemy.orm import Session
+import asyncio
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Response
+from fastapi.responses import FileResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Awaitable, Callable, Optional
 from app.database import get_db
-from app.models import User, OSINTQuery
+from app.models import OSINTQuery, Case
 from app.schemas import ReportRequest
-from app.core.security import get_current_user
-from app.services.report_generator import generate_json_report, generate_pdf_report
-import json
+from app.core.security import get_current_user, AuthenticatedUser
+from app.services.report_generator import generate_json_report, report_snapshot
+from app.services.report_cache import report_cache, report_key, etag_matches, CachedReport
+from app.services.json_stream import write_json
+from app.services.report_workers import render_pdf, RenderQueueFull
+from app.services.case_reports import case_snapshot, write_case_json_report, write_case_pdf_report
 
 router = APIRouter()
 
+def _query_report_key(kind: str, query: OSINTQuery) -> str:
+    return report_key(kind, query.id, {
+        "query_type": query.query_type,
+        "query_value": query.query_value,
+        "risk_score": query.risk_score,
+        "created_at": query.created_at,
+        "results": query.results
+    })
+
+def _report_response(
+    report: CachedReport,
+    media_type: str,
+    filename: str,
+    if_none_match: Optional[str]
+) -> Response:
+    # Authenticated content: clients may keep it but must revalidate
+    headers = {"ETag": report.etag, "Cache-Control": "private, no-cache"}
+    if etag_matches(if_none_match, report.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return FileResponse(
+        report.path,
+        media_type=media_type,
+        headers={**headers, "Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+async def _cached_report(
+    key: str,
+    suffix: str,
+    media_type: str,
+    filename: str,
+    render: Callable[[str], Awaitable[None]],
+    if_none_match: Optional[str]
+) -> Response:
+    """Serve a report from the cache, rendering it to disk on a miss"""
+    try:
+        report = await report_cache.get_or_create(key, suffix, render)
+    except RenderQueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": "5"}
+        )
+    
+    return _report_response(report, media_type, filename, if_none_match)
+
 @router.get("/json/{query_id}")
 async def get_json_report(
     query_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    pretty: bool = False
 ):
-    """Generate JSON report for a query"""
-    query = db.query(OSINTQuery).filter(
+    """Generate JSON report for a query (indented when `pretty` is set)"""
+    query = await db.scalar(select(OSINTQuery).where(
         OSINTQuery.id == query_id,
         OSINTQuery.user_id == current_user.id
-    ).first()
+    ))
     
     if not query:
         raise HTTPException(
@@ -31,27 +86,28 @@ async def get_json_report(
             detail="Query not found"
         )
     
-    report = generate_json_report(query)
-    
-    return Response(
-        content=json.dumps(report, indent=2),
-        media_type="application/json",
-        headers={
-            "Content-Disposition": f"attachment; filename=osint_report_{query_id}.json"
-        }
+    # Encoded chunk by chunk straight to disk in a worker thread
+    return await _cached_report(
+        _query_report_key("json-pretty" if pretty else "json", query),
+        ".json",
+        "application/json",
+        f"osint_report_{query_id}.json",
+        lambda path: asyncio.to_thread(write_json, generate_json_report(query), path, pretty),
+        if_none_match
     )
 
 @router.get("/pdf/{query_id}")
 async def get_pdf_report(
     query_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(None)
 ):
     """Generate PDF report for a query"""
-    query = db.query(OSINTQuery).filter(
+    query = await db.scalar(select(OSINTQuery).where(
         OSINTQuery.id == query_id,
         OSINTQuery.user_id == current_user.id
-    ).first()
+    ))
     
     if not query:
         raise HTTPException(
@@ -59,13 +115,66 @@ async def get_pdf_report(
             detail="Query not found"
         )
     
-    pdf_content = generate_pdf_report(query)
+    return await _cached_report(
+        _query_report_key("pdf", query),
+        ".pdf",
+        "application/pdf",
+        f"osint_report_{query_id}.pdf",
+        lambda path: render_pdf(report_snapshot(query), path),
+        if_none_match
+    )
+
+async def _get_case(case_id: int, user_id: int, db: AsyncSession) -> Case:
+    case = await db.scalar(select(Case).where(
+        Case.id == case_id,
+        Case.user_id == user_id
+    ))
     
-    return Response(
-        content=pdf_content,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename=osint_report_{query_id}.pdf"
-        }
+    if not case:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Case not found"
+        )
+    
+    return case
+
+@router.get("/case/{case_id}/json")
+async def get_case_json_report(
+    case_id: int,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    pretty: bool = False
+):
+    """Generate a consolidated JSON report covering every query in a case"""
+    case = await _get_case(case_id, current_user.id, db)
+    snapshot = await case_snapshot(db, case)
+    
+    return await _cached_report(
+        report_key("case-json-pretty" if pretty else "case-json", case_id, snapshot),
+        ".json",
+        "application/json",
+        f"osint_case_report_{case_id}.json",
+        lambda path: write_case_json_report(snapshot, path, pretty),
+        if_none_match
     )
 
+@router.get("/case/{case_id}/pdf")
+async def get_case_pdf_report(
+    case_id: int,
+    current_user: AuthenticatedUser = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+    if_none_match: Optional[str] = Header(None)
+):
+    """Generate a consolidated PDF report covering every query in a case"""
+    case = await _get_case(case_id, current_user.id, db)
+    snapshot = await case_snapshot(db, case)
+    
+    return await _cached_report(
+        report_key("case-pdf", case_id, snapshot),
+        ".pdf",
+        "application/pdf",
+        f"osint_case_report_{case_id}.pdf",
+        lambda path: write_case_pdf_report(snapshot, path),
+        if_none_match
+    )
@@ -54,6 +54,68 @@ class OSINTQueryResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class OSINTQuerySummary(BaseModel):
+    id: int
+    query_type: str
+    query_value: str
+    risk_score: Optional[str] = None
+    case_id: Optional[int] = None
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+class OSINTQueryPage(BaseModel):
+    items: List[OSINTQuerySummary]
+    next_cursor: Optional[str] = None
+
+class FindingResponse(BaseModel):
+    id: int
+    query_id: int
+    case_id: Optional[int] = None
+    source: str
+    confidence: Optional[str] = None
+    timestamp: Optional[datetime] = None
+    url: Optional[str] = None
+    username: Optional[str] = None
+    email: Optional[str] = None
+    domain: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    
+    class Config:
+        from_attributes = True
+
+class EntityMatch(BaseModel):
+    entity_type: str
+    value: str
+
+class PivotHit(BaseModel):
+    query_id: int
+    query_type: str
+    query_value: str
+    risk_score: Optional[str] = None
+    case_id: Optional[int] = None
+    created_at: datetime
+    matches: List[EntityMatch]
+    sources: List[str]
+    finding_ids: List[int]
+
+class OSINTJobResponse(BaseModel):
+    job_id: str
+    status: str  # queued, running, completed, failed
+    query_type: str
+    query_value: str
+    case_id: Optional[int] = None
+    progress: Dict[str, int]
+    query_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
 # Case schemas
 class CaseCreate(BaseModel):
     name: str
@@ -70,6 +132,23 @@ class CaseResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class CaseSummary(CaseResponse):
+    query_count: int = 0
+    finding_count: int = 0
+    risk_counts: Dict[str, int] = {}
+    last_activity: Optional[datetime] = None
+
+class TimelineEvent(BaseModel):
+    timestamp: datetime
+    source: str
+    event: str
+    query_id: int
+    finding_id: Optional[int] = None
+
+class CaseTimelinePage(BaseModel):
+    items: List[TimelineEvent]
+    next_cursor: Optional[str] = None
+
 # Report schemas
 class ReportRequest(BaseModel):
     query_id: int
@@ -0,0 +1,172 @@
+"""
+Bulk indicator analysis - parse, dedupe and fan out many queries
+"""
+
+import asyncio
+import csv
+import io
+import json
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.normalization import normalize_query_value
+from app.services.osint_engine import osint_engine, QUERY_TYPES
+from app.services.query_store import save_query
+
+logger = logging.getLogger(__name__)
+
+Indicator = Tuple[str, str]
+
+class BulkInputError(ValueError):
+    """Raised when an upload cannot be parsed at all"""
+
+# Shared by every bulk request in this process, so concurrent uploads
+# together never run more than BULK_MAX_CONCURRENCY analyses
+_bulk_semaphore: Optional[asyncio.Semaphore] = None
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _bulk_semaphore
+    if _bulk_semaphore is None:
+        _bulk_semaphore = asyncio.Semaphore(settings.BULK_MAX_CONCURRENCY)
+    return _bulk_semaphore
+
+def _parse_ndjson(text: str) -> List[Dict[str, Any]]:
+    rows = []
+    for line_no, line in enumerate(text.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            raise BulkInputError(f"Line {line_no} is not valid JSON")
+        if not isinstance(row, dict):
+            raise BulkInputError(f"Line {line_no} is not a JSON object")
+        rows.append(row)
+    return rows
+
+def _parse_csv(text: str) -> List[Dict[str, Any]]:
+    reader = csv.reader(io.StringIO(text))
+    rows = [row for row in reader if row and any(cell.strip() for cell in row)]
+    if not rows:
+        return []
+    # Header row is optional; without one, columns are (query_type, query_value)
+    header = [cell.strip().lower() for cell in rows[0]]
+    if "query_type" in header and "query_value" in header:
+        type_col, value_col = header.index("query_type"), header.index("query_value")
+        rows = rows[1:]
+    else:
+        type_col, value_col = 0, 1
+    return [
+        {
+            "query_type": row[type_col] if len(row) > type_col else "",
+            "query_value": row[value_col] if len(row) > value_col else ""
+        }
+        for row in rows
+    ]
+
+def parse_indicators(
+    content: bytes,
+    filename: str = ""
+) -> Tuple[List[Indicator], Dict[str, int]]:
+    """
+    Parse an NDJSON or CSV upload into deduplicated (query_type, query_value)
+    pairs. Returns the indicators and counts of invalid and duplicate rows.
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise BulkInputError("Upload must be UTF-8 text")
+
+    is_ndjson = filename.lower().endswith((".ndjson", ".jsonl")) or text.lstrip().startswith("{")
+    rows = _parse_ndjson(text) if is_ndjson else _parse_csv(text)
+
+    indicators: List[Indicator] = []
+    seen = set()
+    counts = {"invalid": 0, "duplicates": 0}
+    for row in rows:
+        query_type = str(row.get("query_type", "")).strip().lower()
+        query_value = str(row.get("query_value", "")).strip()
+        if query_type not in QUERY_TYPES or not query_value:
+            counts["invalid"] += 1
+            continue
+        key = (query_type, normalize_query_value(query_type, query_value))
+        if key in seen:
+            counts["duplicates"] += 1
+            continue
+        seen.add(key)
+        indicators.append((query_type, query_value))
+
+    if len(indicators) > settings.BULK_MAX_INDICATORS:
+        raise BulkInputError(
+            f"Too many indicators ({len(indicators)}); limit is {settings.BULK_MAX_INDICATORS}"
+        )
+    return indicators, counts
+
+async def _analyze_one(
+    index: int,
+    indicator: Indicator,
+    user_id: int,
+    case_id: Optional[int]
+) -> Dict[str, Any]:
+    query_type, query_value = indicator
+    line = {"index": index, "query_type": query_type, "query_value": query_value}
+    try:
+        async with _get_semaphore():
+            analysis_result = await osint_engine.analyze(query_type, query_value)
+        async with SessionLocal() as db:
+            db_query = await save_query(
+                db, user_id, query_type, query_value, analysis_result, case_id=case_id
+            )
+    except Exception as e:
+        logger.exception("Bulk analysis of %s %r failed", query_type, query_value)
+        return {**line, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+
+    return {
+        **line,
+        "status": "completed",
+        "query_id": db_query.id,
+        "risk_score": db_query.risk_score,
+        "total_findings": len(analysis_result.get("results", []))
+    }
+
+async def run_bulk(
+    indicators: List[Indicator],
+    user_id: int,
+    case_id: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Analyze indicators under the global bulk concurrency cap, yielding one
+    record per indicator in completion order and a summary record last.
+    """
+    work: asyncio.Queue = asyncio.Queue()
+    for item in enumerate(indicators):
+        work.put_nowait(item)
+    done: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        while True:
+            try:
+                index, indicator = work.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await done.put(await _analyze_one(index, indicator, user_id, case_id))
+
+    # A handful of workers per upload; the shared semaphore does the real capping
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(min(settings.BULK_MAX_CONCURRENCY, len(indicators)))
+    ]
+    summary = {"event": "summary", "total": len(indicators), "completed": 0, "failed": 0}
+    try:
+        for _ in range(len(indicators)):
+            record = await done.get()
+            summary[record["status"]] += 1
+            yield {"event": "indicator", **record}
+    finally:
+        # Client went away: stop scheduling the rest
+        for task in workers:
+            task.cancel()
+
+    yield summary
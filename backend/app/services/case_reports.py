@@ -0,0 +1,123 @@
+"""
+Case reports - consolidated reports over every query in a case
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Any, AsyncIterator, BinaryIO, Dict, List
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import SessionLocal
+from app.models import Case, OSINTQuery
+from app.services.report_generator import DISCLAIMER, SOURCE_ATTRIBUTION, report_snapshot
+from app.services.report_workers import render_case_pdf
+from app.services.json_stream import JSONWriter, dumps
+
+# Rows fetched per round trip from the server-side cursor
+CASE_REPORT_BATCH_SIZE = 100
+
+async def case_snapshot(db: AsyncSession, case: Case) -> Dict[str, Any]:
+    """
+    Case fields plus a cheap fingerprint of its queries: count/sum/max of
+    their ids change whenever the set of queries in the case does, and the
+    latest updated_at whenever one of them is edited (e.g. re-correlated).
+    """
+    count, id_sum, last_id, last_update = (await db.execute(
+        select(
+            func.count(OSINTQuery.id),
+            func.coalesce(func.sum(OSINTQuery.id), 0),
+            func.max(OSINTQuery.id),
+            func.max(OSINTQuery.updated_at)
+        ).where(
+            OSINTQuery.case_id == case.id,
+            OSINTQuery.user_id == case.user_id
+        )
+    )).one()
+    return {
+        "id": case.id,
+        "user_id": case.user_id,
+        "name": case.name,
+        "description": case.description,
+        "status": case.status,
+        "created_at": case.created_at.isoformat() if case.created_at else None,
+        "updated_at": case.updated_at.isoformat() if case.updated_at else None,
+        "query_count": count,
+        "query_id_sum": id_sum,
+        "last_query_id": last_id,
+        "last_query_update": str(last_update) if last_update is not None else None
+    }
+
+async def iter_case_queries(case_id: int, user_id: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield report snapshots of a case's queries in id order, one batch at a
+    time, read through a server-side cursor on a dedicated session. Only
+    the case owner's queries are included.
+    """
+    async with SessionLocal() as db:
+        result = await db.stream_scalars(
+            select(OSINTQuery).where(
+                OSINTQuery.case_id == case_id,
+                OSINTQuery.user_id == user_id
+            ).order_by(OSINTQuery.id).execution_options(yield_per=CASE_REPORT_BATCH_SIZE)
+        )
+        async for batch in result.partitions():
+            snapshots = [report_snapshot(query) for query in batch]
+            for query in batch:
+                db.expunge(query)
+            for snapshot in snapshots:
+                if snapshot["created_at"] is not None:
+                    snapshot["created_at"] = snapshot["created_at"].isoformat()
+            yield snapshots
+
+def _write_chunks(f: BinaryIO, chunks: List[bytes]) -> None:
+    f.write(b"".join(chunks))
+
+async def write_case_json_report(case: Dict[str, Any], path: str, pretty: bool = False) -> None:
+    """Write a case JSON report to `path`, one batch of queries at a time"""
+    metadata = {
+        "case_id": case["id"],
+        "name": case["name"],
+        "description": case["description"],
+        "status": case["status"],
+        "created_at": case["created_at"],
+        "query_count": case["query_count"],
+        "generated_at": datetime.utcnow().isoformat()
+    }
+    writer = JSONWriter(pretty)
+    with open(path, "wb") as f:
+        await asyncio.to_thread(_write_chunks, f, [
+            writer.begin_object(),
+            writer.value(metadata, "report_metadata"),
+            writer.value(DISCLAIMER, "disclaimer"),
+            writer.begin_array("queries")
+        ])
+        async for batch in iter_case_queries(case["id"], case["user_id"]):
+            await asyncio.to_thread(_write_chunks, f, [writer.value(snapshot) for snapshot in batch])
+        await asyncio.to_thread(_write_chunks, f, [
+            writer.end(),
+            writer.value(SOURCE_ATTRIBUTION, "source_attribution"),
+            writer.end()
+        ])
+
+async def write_case_pdf_report(case: Dict[str, Any], path: str) -> None:
+    """
+    Spool the case's query snapshots to disk as NDJSON, then have a render
+    worker draw the PDF from the spool
+    """
+    spool_path = f"{path}.spool"
+    try:
+        with open(spool_path, "wb") as spool:
+            async for batch in iter_case_queries(case["id"], case["user_id"]):
+                await asyncio.to_thread(_write_chunks, spool, [dumps(snapshot) + b"\n" for snapshot in batch])
+        await render_case_pdf(case, spool_path, path)
+    finally:
+        await asyncio.to_thread(_remove, spool_path)
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,302 @@
+"""
+Correlation - single-pass entity extraction and cross-source analysis
+"""
+
+import ipaddress
+import re
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from app.services.findings import parse_timestamp
+from app.services.result_filter import signal_results
+
+ENTITY_TYPES = ("username", "email", "domain", "ip", "url")
+
+# Entities listed in the analysis, most widely seen first
+MAX_REPORTED_ENTITIES = 200
+MAX_CROSS_SOURCE_PATTERNS = 50
+
+EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+URL_RE = re.compile(r"https?://[^\s\"'<>]+")
+DOMAIN_RE = re.compile(r"^(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}$")
+
+# Keys whose values name an entity of a known type
+USERNAME_KEYS = {"username", "login", "owner", "handle"}
+EMAIL_KEYS = {"email", "emails"}
+DOMAIN_KEYS = {"domain", "domains", "name_servers", "ns", "cname", "ptr", "mx"}
+IP_KEYS = {"ip", "a", "aaaa"}
+URL_KEYS = {"url", "profile_url", "html_url", "homepage"}
+PRIMARY_KEYS = {"username", "email", "domain"}
+# Free text that may mention identifiers but never *is* one
+TEXT_KEYS = {"note", "disclaimer", "status"}
+
+# Hosts whose first path segment is an account name
+PROFILE_HOSTS = {"github.com", "gitlab.com", "twitter.com", "x.com", "instagram.com", "reddit.com"}
+
+EntityKey = Tuple[str, str]
+
+
+@dataclass
+class Entity:
+    type: str
+    value: str
+    # Where it was seen: the module source, or source/platform for probes
+    origins: Set[str] = field(default_factory=set)
+    sources: Set[str] = field(default_factory=set)
+    occurrences: int = 0
+    # Named by a top-level data field (the only fields scored before)
+    primary: bool = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "type": self.type,
+            "value": self.value,
+            "sources": sorted(self.sources),
+            "origins": sorted(self.origins),
+            "occurrences": self.occurrences
+        }
+
+
+def normalize_entity(entity_type: str, value: str) -> Optional[str]:
+    """Canonical form of an identifier, or None if it is not a valid one"""
+    value = value.strip()
+    if not value:
+        return None
+    if entity_type == "email":
+        return value.lower() if EMAIL_RE.fullmatch(value) else None
+    if entity_type == "domain":
+        value = value.lower().rstrip(".")
+        if value.startswith("www."):
+            value = value[4:]
+        return value if DOMAIN_RE.match(value) else None
+    if entity_type == "ip":
+        try:
+            return str(ipaddress.ip_address(value))
+        except ValueError:
+            return None
+    if entity_type == "url":
+        return value.rstrip(".,;)")
+    return value.lower()
+
+
+def _origin(source: str, platform: Any) -> str:
+    return f"{source}/{platform}" if isinstance(platform, str) and platform else source
+
+
+class EntityIndex:
+    """
+    Index of every identifier found in a result list, built in one pass.
+    Each result is walked once; work per result is linear in its size.
+    """
+
+    def __init__(self):
+        self.entities: Dict[EntityKey, Entity] = {}
+        self.sources: Set[str] = set()
+        self.timeline: List[Tuple[Any, Dict[str, Any]]] = []
+        self.total_findings = 0
+        # Everyone who reported the result being walked (merged duplicates
+        # list their other contributors under "provenance")
+        self._sources: Set[str] = set()
+        self._origins: Set[str] = set()
+
+    def _add(self, entity_type: str, raw: Any, primary: bool = False) -> None:
+        if not isinstance(raw, str):
+            return
+        value = normalize_entity(entity_type, raw)
+        if value is None:
+            return
+        key = (entity_type, value)
+        entity = self.entities.get(key)
+        if entity is None:
+            entity = self.entities[key] = Entity(entity_type, value)
+        entity.sources.update(self._sources)
+        entity.origins.update(self._origins)
+        entity.occurrences += 1
+        entity.primary = entity.primary or primary
+
+    def _add_url(self, raw: str) -> None:
+        self._add("url", raw)
+        try:
+            parts = urlsplit(raw)
+        except ValueError:
+            return
+        host = (parts.hostname or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        self._add("domain", host)
+        if host in PROFILE_HOSTS:
+            segment = parts.path.strip("/").split("/", 1)[0]
+            if segment:
+                self._add("username", segment)
+
+    def _scan_text(self, text: str) -> None:
+        for match in EMAIL_RE.finditer(text):
+            self._add("email", match.group())
+        for match in URL_RE.finditer(text):
+            self._add_url(match.group())
+
+    def _walk(self, value: Any, key: str, depth: int) -> None:
+        if isinstance(value, dict):
+            for child_key, child in value.items():
+                self._walk(child, str(child_key).lower(), depth + 1)
+            return
+        if isinstance(value, list):
+            for child in value:
+                self._walk(child, key, depth)
+            return
+        if not isinstance(value, str):
+            return
+
+        # Only the fields scored before this index existed count as primary
+        primary = depth == 1 and key in PRIMARY_KEYS
+        if key in USERNAME_KEYS:
+            self._add("username", value, primary)
+        elif key in EMAIL_KEYS:
+            self._add("email", value, primary)
+        elif key in DOMAIN_KEYS:
+            # MX records read "<preference> <host>"
+            self._add("domain", value.split()[-1] if value.split() else value, primary)
+        elif key in IP_KEYS:
+            self._add("ip", value, primary)
+        elif key in URL_KEYS or value.startswith(("http://", "https://")):
+            self._add_url(value)
+        elif key not in TEXT_KEYS:
+            self._scan_text(value)
+
+    def add_result(self, result: Dict[str, Any]) -> None:
+        if not isinstance(result, dict):
+            return
+        source = result.get("source") or "unknown"
+        data = result.get("data") if isinstance(result.get("data"), dict) else {}
+        origin = _origin(source, data.get("platform"))
+        self._sources = {source}
+        self._origins = {origin}
+        for contributor in result.get("provenance") or []:
+            if isinstance(contributor, dict) and contributor.get("source"):
+                self._sources.add(contributor["source"])
+                self._origins.add(_origin(contributor["source"], contributor.get("platform")))
+
+        self.sources.update(self._sources)
+        self.total_findings += 1
+        self._walk(data, "", 0)
+        if isinstance(result.get("url"), str):
+            self._add_url(result["url"])
+
+        if "timestamp" in result:
+            self.timeline.append((
+                parse_timestamp(result["timestamp"]),
+                {
+                    "date": result["timestamp"],
+                    "source": source,
+                    "event": data.get("description") or "Activity detected"
+                }
+            ))
+
+    def by_type(self, entity_type: str) -> Iterator[Entity]:
+        return (entity for entity in self.entities.values() if entity.type == entity_type)
+
+
+def result_entities(result: Dict[str, Any]) -> List[Entity]:
+    """Distinct entities mentioned by a single result"""
+    index = EntityIndex()
+    index.add_result(result)
+    return list(index.entities.values())
+
+
+def build_index(results: List[Dict[str, Any]]) -> EntityIndex:
+    index = EntityIndex()
+    for result in results:
+        index.add_result(result)
+    return index
+
+
+def _patterns(index: EntityIndex) -> List[Dict[str, Any]]:
+    patterns = []
+    reused = [entity for entity in index.by_type("username") if len(entity.origins) > 1]
+    if reused:
+        platforms = sorted(set().union(*(entity.origins for entity in reused)))
+        patterns.append({
+            "type": "username_reuse",
+            "description": f"Username found across {len(platforms)} different platforms",
+            "usernames": sorted(entity.value for entity in reused),
+            "platforms": platforms
+        })
+
+    shared = sorted(
+        (entity for entity in index.entities.values() if len(entity.sources) > 1 and entity.type != "url"),
+        key=lambda entity: (-len(entity.sources), entity.type, entity.value)
+    )
+    for entity in shared[:MAX_CROSS_SOURCE_PATTERNS]:
+        patterns.append({
+            "type": "cross_source_entity",
+            "description": f"{entity.type.capitalize()} {entity.value} seen in {len(entity.sources)} sources",
+            "entity_type": entity.type,
+            "value": entity.value,
+            "sources": sorted(entity.sources)
+        })
+    return patterns
+
+
+def _risk_score(index: EntityIndex) -> str:
+    """
+    Informational score. Counts only identifiers named by top-level data
+    fields, so deeper extraction (name servers, URLs) does not inflate it.
+    """
+    emails = sum(1 for entity in index.by_type("email") if entity.primary)
+    domains = sum(1 for entity in index.by_type("domain") if entity.primary)
+    risk_factors = 0
+    if index.total_findings > 10:
+        risk_factors += 1
+    if emails > 0:
+        risk_factors += 1
+    if domains > 1:
+        risk_factors += 1
+
+    if risk_factors >= 2:
+        return "HIGH"
+    if risk_factors == 1:
+        return "MEDIUM"
+    return "LOW"
+
+
+def correlate(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Analysis block (patterns, timeline, entities, risk) for a result list"""
+    index = build_index(results)
+
+    # Unparseable timestamps sort first, in arrival order
+    index.timeline.sort(key=lambda item: item[0] or datetime.min)
+    entities = sorted(
+        index.entities.values(),
+        key=lambda entity: (-len(entity.sources), -entity.occurrences, entity.type, entity.value)
+    )
+    entity_counts = {entity_type: 0 for entity_type in ENTITY_TYPES}
+    for entity in entities:
+        entity_counts[entity.type] += 1
+
+    return {
+        "total_sources": len(index.sources),
+        "total_findings": index.total_findings,
+        "patterns": _patterns(index),
+        "timeline": [event for _, event in index.timeline],
+        "entities": [entity.as_dict() for entity in entities[:MAX_REPORTED_ENTITIES]],
+        "entity_counts": entity_counts,
+        "risk_score": _risk_score(index)
+    }
+
+
+def recorrelate(blob: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Recompute the analysis of a stored results blob (OSINTQuery.results) in
+    place and return it
+    """
+    results = blob.get("results") if isinstance(blob.get("results"), list) else []
+    previous = blob.get("analysis") if isinstance(blob.get("analysis"), dict) else {}
+    analysis = correlate(signal_results(results))
+    # The stored results are already filtered; only the original run saw the input counts
+    if "filtering" in previous:
+        analysis["filtering"] = previous["filtering"]
+    blob["analysis"] = analysis
+    blob["risk_score"] = analysis["risk_score"]
+    return blob
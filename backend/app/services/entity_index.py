@@ -0,0 +1,156 @@
+"""
+Entity index - cross-query inverted index of normalized entities
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import and_, delete, exists, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import EntityOccurrence, Finding, OSINTQuery
+from app.services.findings import backfill_done, mark_backfill_done, reindex_queries
+from app.services.correlation import ENTITY_TYPES, normalize_entity, result_entities
+
+logger = logging.getLogger(__name__)
+
+# Query types whose indicator is itself an indexable entity
+QUERY_ENTITY_TYPES = {"username", "email", "domain", "ip"}
+
+def build_occurrences(db_query: OSINTQuery, findings: Sequence[Finding]) -> List[EntityOccurrence]:
+    """Index rows for a query's own indicator and every entity in its (flushed) findings"""
+    rows = []
+    if db_query.query_type in QUERY_ENTITY_TYPES:
+        value = normalize_entity(db_query.query_type, db_query.query_value)
+        if value is not None:
+            rows.append(EntityOccurrence(
+                entity_type=db_query.query_type,
+                value=value,
+                query_id=db_query.id,
+                user_id=db_query.user_id,
+                source="query"
+            ))
+
+    for finding in findings:
+        result = {"source": finding.source, "data": finding.data or {}, "url": finding.url}
+        for entity in result_entities(result):
+            rows.append(EntityOccurrence(
+                entity_type=entity.type,
+                value=entity.value,
+                query_id=db_query.id,
+                finding_id=finding.id,
+                user_id=db_query.user_id,
+                source=finding.source
+            ))
+    return rows
+
+async def backfill_entity_index(db: AsyncSession, batch_size: int = 200) -> int:
+    """Index queries that have no entries yet, until it completes once. Returns the number processed."""
+    if await backfill_done(db, "entity_index"):
+        return 0
+    processed = await reindex_queries(
+        db, ~exists().where(EntityOccurrence.query_id == OSINTQuery.id), build_occurrences, batch_size
+    )
+    await mark_backfill_done(db, "entity_index")
+    if processed:
+        logger.info("Indexed entities for %d queries", processed)
+    return processed
+
+async def rebuild_entity_index(db: AsyncSession, user_id: Optional[int] = None, batch_size: int = 200) -> int:
+    """Drop and re-create index entries, for one user or for everyone"""
+    if user_id is None:
+        await db.execute(delete(EntityOccurrence))
+        condition = OSINTQuery.id.is_not(None)
+    else:
+        await db.execute(delete(EntityOccurrence).where(EntityOccurrence.user_id == user_id))
+        condition = OSINTQuery.user_id == user_id
+    await db.commit()
+    return await reindex_queries(db, condition, build_occurrences, batch_size)
+
+def lookup_keys(value: str, entity_type: Optional[str] = None) -> List[tuple]:
+    """(entity_type, normalized value) pairs a raw pivot value can match"""
+    types = [entity_type] if entity_type else ENTITY_TYPES
+    keys = []
+    for candidate in types:
+        normalized = normalize_entity(candidate, value)
+        if normalized is not None:
+            keys.append((candidate, normalized))
+    return keys
+
+async def pivot(
+    db: AsyncSession,
+    user_id: int,
+    value: str,
+    entity_type: Optional[str] = None,
+    limit: int = 50
+) -> List[Dict[str, Any]]:
+    """
+    Queries of `user_id` that surfaced `value`, newest first, with the
+    sources and findings it appeared in. Served entirely from the index.
+    """
+    keys = lookup_keys(value, entity_type)
+    if not keys:
+        return []
+    matches = or_(*(
+        and_(EntityOccurrence.entity_type == key_type, EntityOccurrence.value == key_value)
+        for key_type, key_value in keys
+    ))
+
+    query_ids = (await db.scalars(
+        select(EntityOccurrence.query_id).where(
+            EntityOccurrence.user_id == user_id, matches
+        ).distinct().order_by(EntityOccurrence.query_id.desc()).limit(limit)
+    )).all()
+    if not query_ids:
+        return []
+
+    rows = (await db.execute(
+        select(
+            EntityOccurrence.query_id,
+            EntityOccurrence.entity_type,
+            EntityOccurrence.value,
+            EntityOccurrence.source,
+            EntityOccurrence.finding_id,
+            OSINTQuery.query_type,
+            OSINTQuery.query_value,
+            OSINTQuery.risk_score,
+            OSINTQuery.case_id,
+            OSINTQuery.created_at
+        ).join(
+            OSINTQuery, OSINTQuery.id == EntityOccurrence.query_id
+        ).where(
+            EntityOccurrence.user_id == user_id,
+            EntityOccurrence.query_id.in_(query_ids),
+            matches
+        )
+    )).all()
+
+    hits: Dict[int, Dict[str, Any]] = {}
+    for row in rows:
+        hit = hits.get(row.query_id)
+        if hit is None:
+            hit = hits[row.query_id] = {
+                "query_id": row.query_id,
+                "query_type": row.query_type,
+                "query_value": row.query_value,
+                "risk_score": row.risk_score,
+                "case_id": row.case_id,
+                "created_at": row.created_at,
+                "matches": set(),
+                "sources": set(),
+                "finding_ids": set()
+            }
+        hit["matches"].add((row.entity_type, row.value))
+        hit["sources"].add(row.source)
+        if row.finding_id is not None:
+            hit["finding_ids"].add(row.finding_id)
+
+    return [
+        {
+            **hit,
+            "matches": [{"entity_type": t, "value": v} for t, v in sorted(hit["matches"])],
+            "sources": sorted(hit["sources"]),
+            "finding_ids": sorted(hit["finding_ids"])
+        }
+        for hit in (hits[query_id] for query_id in query_ids)
+    ]
@@ -0,0 +1,141 @@
+"""
+Findings storage - normalized, indexed rows for each query result
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import BackfillMarker, Finding, OSINTQuery
+from app.services.result_filter import is_placeholder
+
+logger = logging.getLogger(__name__)
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse a result timestamp (ISO string) into a naive UTC datetime"""
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _entity(data: Dict[str, Any], key: str) -> Optional[str]:
+    value = data.get(key)
+    return value.strip().lower() if isinstance(value, str) and value.strip() else None
+
+def build_findings(db_query: OSINTQuery) -> List[Finding]:
+    """
+    Finding rows for every result stored in a query's results blob.
+    Placeholders kept under the "flag" policy stay in the blob only, so they
+    never reach findings, the entity index or timelines.
+    """
+    blob = db_query.results if isinstance(db_query.results, dict) else {}
+    findings = []
+    for result in blob.get("results", []):
+        if not isinstance(result, dict) or is_placeholder(result):
+            continue
+        data = result.get("data") if isinstance(result.get("data"), dict) else {}
+        findings.append(Finding(
+            query_id=db_query.id,
+            user_id=db_query.user_id,
+            case_id=db_query.case_id,
+            source=result.get("source") or "unknown",
+            confidence=result.get("confidence"),
+            timestamp=parse_timestamp(result.get("timestamp")),
+            url=result.get("url"),
+            username=_entity(data, "username"),
+            email=_entity(data, "email"),
+            domain=_entity(data, "domain"),
+            data=data
+        ))
+    return findings
+
+async def backfill_done(db: AsyncSession, name: str) -> bool:
+    return await db.get(BackfillMarker, name) is not None
+
+async def mark_backfill_done(db: AsyncSession, name: str) -> None:
+    """
+    Record a finished backfill. Queries saved afterwards get their rows at
+    save time, and queries with legitimately none must not be rescanned on
+    every start.
+    """
+    db.add(BackfillMarker(name=name))
+    await db.commit()
+
+async def backfill_findings(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Migration for rows saved before the findings table existed: expand the
+    results blob of every query that has no findings yet. Runs until it
+    completes once; returns the number of queries processed.
+    """
+    if await backfill_done(db, "findings"):
+        return 0
+    processed = 0
+    last_id = 0
+    while True:
+        queries = (await db.scalars(
+            select(OSINTQuery).where(
+                OSINTQuery.id > last_id,
+                ~exists().where(Finding.query_id == OSINTQuery.id)
+            ).order_by(OSINTQuery.id).limit(batch_size)
+        )).all()
+        if not queries:
+            break
+        for db_query in queries:
+            db.add_all(build_findings(db_query))
+        await db.commit()
+        processed += len(queries)
+        last_id = queries[-1].id
+        # Drop the processed blobs from the identity map before the next batch
+        db.expunge_all()
+
+    await mark_backfill_done(db, "findings")
+    if processed:
+        logger.info("Backfilled findings for %d queries", processed)
+    return processed
+
+async def reindex_queries(
+    db: AsyncSession,
+    condition: Any,
+    build: Callable[[OSINTQuery, Sequence[Finding]], List[Any]],
+    batch_size: int = 200
+) -> int:
+    """
+    Derive rows from stored queries matching `condition`: `build` gets each
+    query with its findings and returns rows to add. Works in id-ordered
+    batches, committing each. Returns the number of queries processed.
+    """
+    processed = 0
+    last_id = 0
+    while True:
+        queries = (await db.scalars(
+            select(OSINTQuery).where(
+                OSINTQuery.id > last_id, condition
+            ).order_by(OSINTQuery.id).limit(batch_size)
+        )).all()
+        if not queries:
+            break
+        findings = defaultdict(list)
+        for finding in (await db.scalars(
+            select(Finding).where(Finding.query_id.in_([query.id for query in queries]))
+        )).all():
+            findings[finding.query_id].append(finding)
+        for db_query in queries:
+            db.add_all(build(db_query, findings[db_query.id]))
+        await db.commit()
+        processed += len(queries)
+        last_id = queries[-1].id
+        db.expunge_all()
+    return processed
+
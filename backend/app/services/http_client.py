@@ -0,0 +1,98 @@
+"""
+Shared HTTP client - one pooled connection pool for all OSINT modules
+"""
+
+import asyncio
+import importlib.util
+from typing import AsyncIterator, Callable, Dict
+
+import httpx
+
+from app.core.config import settings
+from app.services.rate_limiter import rate_limiter
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response stream that frees its per-host slot once the body is closed"""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if not self._released:
+                self._released = True
+                self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Transport wrapper capping concurrent connections per destination host.
+    httpx only limits the pool as a whole, so one slow upstream could
+    otherwise take every connection in it.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int):
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self._max_per_host)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request.url.host)
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if response.is_closed:
+            # Body was already fully loaded by the transport
+            semaphore.release()
+            return response
+        response.stream = _ReleasingStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (httpx[http2])"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Build the application-wide pooled client (keep-alive, HTTP/2 where possible).
+    Every request, redirects included, waits on the per-host rate limiter.
+    """
+    limits = httpx.Limits(
+        max_connections=settings.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+    )
+    transport = httpx.AsyncHTTPTransport(
+        http2=settings.HTTP2_ENABLED and http2_available(),
+        limits=limits,
+    )
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, settings.HTTP_MAX_CONNECTIONS_PER_HOST),
+        timeout=settings.HTTP_TIMEOUT,
+        headers={"User-Agent": settings.HTTP_USER_AGENT},
+        event_hooks={"request": [rate_limiter.on_request]},
+    )
@@ -0,0 +1,165 @@
+"""
+Background job execution for OSINT queries
+"""
+
+import asyncio
+import logging
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+from app.database import SessionLocal
+from app.services.osint_engine import osint_engine
+from app.services.query_store import save_query
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+class JobQueueFull(Exception):
+    """Raised when the bounded job queue cannot take more work"""
+
+@dataclass
+class Job:
+    job_id: str
+    user_id: int
+    query_type: str
+    query_value: str
+    case_id: Optional[int] = None
+    status: str = JOB_QUEUED
+    modules_total: int = 0
+    modules_done: int = 0
+    query_id: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    # Monotonic completion time, used for retention
+    finished_monotonic: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def progress(self) -> Dict[str, int]:
+        return {"modules_done": self.modules_done, "modules_total": self.modules_total}
+
+class JobQueue:
+    """
+    Bounded queue of analysis jobs drained by a fixed pool of worker tasks.
+    Job state lives in process memory and is kept for JOB_RETENTION_SECONDS
+    after completion; the analysis itself is persisted as an OSINTQuery.
+    """
+
+    def __init__(self, workers: int, max_queue_size: int, retention_seconds: int):
+        self.workers = workers
+        self.max_queue_size = max_queue_size
+        self.retention_seconds = retention_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._jobs: Dict[str, Job] = {}
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"osint-job-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._queue = None
+
+    def submit(
+        self,
+        user_id: int,
+        query_type: str,
+        query_value: str,
+        case_id: Optional[int] = None
+    ) -> Job:
+        """Queue an analysis and return its job at once"""
+        if self._queue is None:
+            raise RuntimeError("Job queue is not running")
+        self._prune()
+
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            user_id=user_id,
+            query_type=query_type,
+            query_value=query_value,
+            case_id=case_id,
+            modules_total=len(osint_engine.scheduled_modules(query_type))
+        )
+        try:
+            self._queue.put_nowait(job)
+        except asyncio.QueueFull:
+            raise JobQueueFull()
+        self._jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str, user_id: int) -> Optional[Job]:
+        job = self._jobs.get(job_id)
+        if job is None or job.user_id != user_id:
+            return None
+        return job
+
+    def _prune(self) -> None:
+        cutoff = time.monotonic() - self.retention_seconds
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.finished_monotonic is not None and job.finished_monotonic < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = JOB_RUNNING
+        job.started_at = datetime.utcnow()
+        try:
+            analysis_result = None
+            async for event in osint_engine.analyze_stream(job.query_type, job.query_value):
+                if event["event"] == "module":
+                    job.modules_done += 1
+                else:
+                    analysis_result = event["result"]
+                    job.modules_done = job.modules_total
+
+            async with SessionLocal() as db:
+                db_query = await save_query(
+                    db, job.user_id, job.query_type, job.query_value,
+                    analysis_result, case_id=job.case_id
+                )
+            job.query_id = db_query.id
+            job.status = JOB_COMPLETED
+        except asyncio.CancelledError:
+            job.status = JOB_FAILED
+            job.error = "Cancelled during shutdown"
+            raise
+        except Exception as e:
+            logger.exception("OSINT job %s failed", job.job_id)
+            job.status = JOB_FAILED
+            job.error = f"{type(e).__name__}: {e}"
+        finally:
+            job.finished_at = datetime.utcnow()
+            job.finished_monotonic = time.monotonic()
+
+# Global instance
+job_queue = JobQueue(
+    workers=settings.JOB_WORKERS,
+    max_queue_size=settings.JOB_QUEUE_MAX_SIZE,
+    retention_seconds=settings.JOB_RETENTION_SECONDS
+)
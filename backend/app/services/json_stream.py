@@ -0,0 +1,103 @@
+"""
+Streaming JSON - incremental encoding of large report documents
+"""
+
+import json
+from typing import Any, Iterator, List, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speedup, the stdlib encoder is the fallback
+    orjson = None
+
+def dumps(value: Any, pretty: bool = False) -> bytes:
+    """Encode one value with orjson when installed, otherwise the json module"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(value, default=str, option=option)
+    if pretty:
+        return json.dumps(value, indent=2, default=str).encode()
+    return json.dumps(value, separators=(",", ":"), default=str).encode()
+
+
+class JSONWriter:
+    """
+    Incremental encoder for a document emitted member by member. Each call
+    returns the bytes to write next; the output matches encoding the whole
+    document at once (`indent=2` when pretty, compact otherwise).
+    """
+
+    def __init__(self, pretty: bool = False):
+        self.pretty = pretty
+        # One [is_object, members written] frame per open container
+        self._stack: List[list] = []
+
+    def _newline(self, level: int) -> bytes:
+        return b"\n" + b"  " * level if self.pretty else b""
+
+    def _member_prefix(self, key: Optional[str]) -> bytes:
+        if not self._stack:
+            return b""
+        frame = self._stack[-1]
+        prefix = (b"," if frame[1] else b"") + self._newline(len(self._stack))
+        frame[1] += 1
+        if frame[0]:
+            prefix += dumps(str(key)) + (b": " if self.pretty else b":")
+        return prefix
+
+    def begin_object(self, key: Optional[str] = None) -> bytes:
+        prefix = self._member_prefix(key)
+        self._stack.append([True, 0])
+        return prefix + b"{"
+
+    def begin_array(self, key: Optional[str] = None) -> bytes:
+        prefix = self._member_prefix(key)
+        self._stack.append([False, 0])
+        return prefix + b"["
+
+    def end(self) -> bytes:
+        is_object, count = self._stack.pop()
+        closing = b"}" if is_object else b"]"
+        return (self._newline(len(self._stack)) if count else b"") + closing
+
+    def value(self, value: Any, key: Optional[str] = None) -> bytes:
+        """One complete member (or array element), encoded in a single piece"""
+        prefix = self._member_prefix(key)
+        chunk = dumps(value, self.pretty)
+        if self.pretty and self._stack:
+            chunk = chunk.replace(b"\n", self._newline(len(self._stack)))
+        return prefix + chunk
+
+    def iter_value(self, value: Any, key: Optional[str] = None, stream_depth: int = 3) -> Iterator[bytes]:
+        """
+        Yield `value` in chunks. Objects and arrays fewer than `stream_depth`
+        levels below the current one are emitted member by member, anything
+        deeper in one piece.
+        """
+        if stream_depth <= 0 or not isinstance(value, (dict, list)) or not value:
+            yield self.value(value, key)
+            return
+        if isinstance(value, dict):
+            yield self.begin_object(key)
+            for member_key, member in value.items():
+                yield from self.iter_value(member, member_key, stream_depth - 1)
+        else:
+            yield self.begin_array(key)
+            for member in value:
+                yield from self.iter_value(member, None, stream_depth - 1)
+        yield self.end()
+
+
+def iter_json(value: Any, pretty: bool = False, stream_depth: int = 3) -> Iterator[bytes]:
+    """
+    Encode `value` as a stream of chunks, so a document with a huge results
+    array is never held in memory as one string
+    """
+    return JSONWriter(pretty).iter_value(value, stream_depth=stream_depth)
+
+
+def write_json(value: Any, path: str, pretty: bool = False) -> None:
+    """Encode `value` into the file at `path` chunk by chunk (blocking)"""
+    with open(path, "wb") as f:
+        for chunk in iter_json(value, pretty):
+            f.write(chunk)
@@ -1,22 +1,26 @@
 """
 OSINT data collection modules
+
+Modules are declared in the registry and imported on first use; import a
+module's function from its own submodule when it is needed directly.
 """
 
-from .search_engine import search_engine_module
-from .social_media import social_media_module
-from .whois_dns import whois_dns_module
-from .breach_db import breach_db_module
-from .github import github_module
-from .paste_sites import paste_sites_module
-from .news_forum import news_forum_module
+from .registry import (
+    COST_BLOCKING,
+    COST_LOCAL,
+    COST_NETWORK,
+    ENTRY_POINT_GROUP,
+    ModuleRegistry,
+    ModuleSpec,
+    module_registry
+)
 
 __all__ = [
-    "search_engine_module",
-    "social_media_module",
-    "whois_dns_module",
-    "breach_db_module",
-    "github_module",
-    "paste_sites_module",
-    "news_forum_module"
+    "COST_BLOCKING",
+    "COST_LOCAL",
+    "COST_NETWORK",
+    "ENTRY_POINT_GROUP",
+    "ModuleRegistry",
+    "ModuleSpec",
+    "module_registry"
 ]
-
@@ -2,37 +2,34 @@
 News & Forum Module - Public news and forum mentions
 """
 
-import asyncio
 import httpx
 from typing import List, Dict, Any
 from datetime import datetime
 from urllib.parse import quote
 
-async def news_forum_module(query_type: str, query_value: str) -> List[Dict[str, Any]]:
+async def news_forum_module(
+    query_type: str,
+    query_value: str,
+    client: httpx.AsyncClient
+) -> List[Dict[str, Any]]:
     """Search news and public forums"""
     results = []
     
-    # Rate limiting
-    await asyncio.sleep(0.4)
+    # Simulated news/forum search
+    # In production, you'd use news APIs (NewsAPI, etc.) and forum search APIs
     
-    try:
-        # Simulated news/forum search
-        # In production, you'd use news APIs (NewsAPI, etc.) and forum search APIs
-        
-        results.append({
-            "source": "news_forum",
-            "data": {
-                "query": query_value,
-                "query_type": query_type,
-                "note": "News and forum search simulation. Actual implementation would use proper news/forum APIs.",
-                "disclaimer": "Only public content is searched. No private forums or paywalled content accessed."
-            },
-            "confidence": "LOW",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    
-    except Exception:
-        pass
+    results.append({
+        "source": "news_forum",
+        "data": {
+            "query": query_value,
+            "query_type": query_type,
+            "note": "News and forum search simulation. Actual implementation would use proper news/forum APIs.",
+            "disclaimer": "Only public content is searched. No private forums or paywalled content accessed."
+        },
+        "confidence": "LOW",
+        "timestamp": datetime.utcnow().isoformat(),
+        "simulated": True
+    })
     
     return results
 
@@ -2,42 +2,39 @@
 Paste Sites Module - Public paste information
 """
 
-import asyncio
 import httpx
 from typing import List, Dict, Any
 from datetime import datetime
 from urllib.parse import quote
 
-async def paste_sites_module(query_type: str, query_value: str) -> List[Dict[str, Any]]:
+async def paste_sites_module(
+    query_type: str,
+    query_value: str,
+    client: httpx.AsyncClient
+) -> List[Dict[str, Any]]:
     """Search public paste sites"""
     results = []
     
     if query_type not in ["email", "username", "domain"]:
         return results
     
-    # Rate limiting
-    await asyncio.sleep(0.5)
-    
     # Note: Actual paste site APIs vary. This is a simulation.
     # In production, you'd use proper APIs like Pastebin API (if available)
     
-    try:
-        # Simulated paste site check
-        # Real implementation would use actual paste site APIs
-        results.append({
-            "source": "paste_sites",
-            "data": {
-                "query": query_value,
-                "query_type": query_type,
-                "note": "Paste site search simulation. Actual implementation would query public paste APIs.",
-                "disclaimer": "Only public pastes are checked. No private or password-protected content accessed."
-            },
-            "confidence": "LOW",
-            "timestamp": datetime.utcnow().isoformat()
-        })
-    
-    except Exception:
-        pass
+    # Simulated paste site check
+    # Real implementation would use actual paste site APIs
+    results.append({
+        "source": "paste_sites",
+        "data": {
+            "query": query_value,
+            "query_type": query_type,
+            "note": "Paste site search simulation. Actual implementation would query public paste APIs.",
+            "disclaimer": "Only public pastes are checked. No private or password-protected content accessed."
+        },
+        "confidence": "LOW",
+        "timestamp": datetime.utcnow().isoformat(),
+        "simulated": True
+    })
     
     return results
 
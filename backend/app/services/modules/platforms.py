@@ -0,0 +1,73 @@
+"""
+Social platform registry - data-driven site list for username probing
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Pattern, Tuple
+from urllib.parse import quote
+
+from app.core.config import settings
+
+DEFAULT_PLATFORMS_FILE = Path(__file__).parent / "data" / "social_platforms.json"
+
+# Existence heuristics:
+#   status_code  - profile exists when the probe answers 2xx (redirects not followed)
+#   message      - profile exists unless the body contains one of `absent_text`
+#   response_url - profile exists unless the probe redirects elsewhere
+CHECK_TYPES = ("status_code", "message", "response_url")
+
+@dataclass(frozen=True)
+class Platform:
+    name: str
+    url: str
+    category: str = "other"
+    check: str = "status_code"
+    probe_url: Optional[str] = None
+    method: str = "HEAD"
+    absent_text: Tuple[str, ...] = ()
+    regex: Optional[Pattern[str]] = None
+
+    def accepts(self, username: str) -> bool:
+        """Whether the username is valid on this platform at all"""
+        return self.regex is None or self.regex.match(username) is not None
+
+    def profile_url(self, username: str) -> str:
+        return self.url.format(username=quote(username))
+
+    def request_url(self, username: str) -> str:
+        return (self.probe_url or self.url).format(username=quote(username))
+
+    @property
+    def request_method(self) -> str:
+        # Body heuristics need the page content
+        return "GET" if self.check == "message" else self.method
+
+def _parse_platform(entry: dict) -> Platform:
+    check = entry.get("check", "status_code")
+    if check not in CHECK_TYPES:
+        raise ValueError(f"Unknown check type {check!r} for platform {entry.get('name')!r}")
+    if "{username}" not in entry["url"]:
+        raise ValueError(f"Platform {entry['name']!r} URL has no {{username}} placeholder")
+
+    return Platform(
+        name=entry["name"],
+        url=entry["url"],
+        category=entry.get("category", "other"),
+        check=check,
+        probe_url=entry.get("probe_url"),
+        method=entry.get("method", "HEAD").upper(),
+        absent_text=tuple(entry.get("absent_text", ())),
+        regex=re.compile(entry["regex"]) if entry.get("regex") else None
+    )
+
+@lru_cache(maxsize=None)
+def load_platforms(path: Optional[str] = None) -> List[Platform]:
+    """Load (once) the platform registry from `path`, Settings, or the bundled file"""
+    registry_file = Path(path or settings.SOCIAL_PLATFORMS_FILE or DEFAULT_PLATFORMS_FILE)
+    with registry_file.open(encoding="utf-8") as f:
+        entries = json.load(f)
+    return [_parse_platform(entry) for entry in entries]
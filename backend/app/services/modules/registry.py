@@ -0,0 +1,179 @@
+"""
+Module registry - declared OSINT modules, discovered via entry points and imported on first use
+"""
+
+import importlib
+import importlib.util
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Third-party packages register ModuleSpec objects under this group, e.g.
+#   [project.entry-points."osint_tool.modules"]
+#   shodan = "osint_shodan.spec:SPEC"
+# The entry point should name a lightweight spec; its target is only
+# imported once a query actually needs it.
+ENTRY_POINT_GROUP = "osint_tool.modules"
+
+# Cost classes, scheduled most expensive first so slow modules start earliest
+COST_LOCAL = "local"  # no I/O beyond process memory
+COST_NETWORK = "network"  # outbound HTTP through the shared client
+COST_BLOCKING = "blocking"  # blocking libraries run in a thread pool
+COST_ORDER = {COST_BLOCKING: 0, COST_NETWORK: 1, COST_LOCAL: 2}
+
+ModuleFunc = Callable[..., Any]
+
+
+@dataclass(frozen=True)
+class ModuleSpec:
+    """Declaration of a module: what it handles and how to load it"""
+    name: str
+    # "package.module:function"
+    target: str
+    # Query types it can answer; empty means every type
+    query_types: FrozenSet[str] = frozenset()
+    cost: str = COST_NETWORK
+    # Top-level import names it needs beyond the core requirements
+    dependencies: Tuple[str, ...] = ()
+    # "package.module:function" called at shutdown, only if the module was loaded
+    shutdown: Optional[str] = None
+
+    def applies_to(self, query_type: str) -> bool:
+        return not self.query_types or query_type in self.query_types
+
+    def missing_dependencies(self) -> List[str]:
+        return [name for name in self.dependencies if not _importable(name)]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "query_types": sorted(self.query_types),
+            "cost": self.cost,
+            "dependencies": list(self.dependencies)
+        }
+
+
+@lru_cache(maxsize=None)
+def _importable(name: str) -> bool:
+    """Whether a top-level package is installed, without importing it"""
+    return importlib.util.find_spec(name) is not None
+
+
+def _resolve(target: str) -> Any:
+    module_path, _, attribute = target.partition(":")
+    return getattr(importlib.import_module(module_path), attribute)
+
+
+BUILTIN_MODULES = (
+    ModuleSpec(
+        "search", "app.services.modules.search_engine:search_engine_module"
+    ),
+    ModuleSpec(
+        "social", "app.services.modules.social_media:social_media_module",
+        query_types=frozenset({"username"})
+    ),
+    ModuleSpec(
+        "whois_dns", "app.services.modules.whois_dns:whois_dns_module",
+        query_types=frozenset({"domain", "ip"}),
+        cost=COST_BLOCKING,
+        dependencies=("whois", "dns"),
+        shutdown="app.services.modules.whois_dns:shutdown_whois_executor"
+    ),
+    ModuleSpec(
+        "breach", "app.services.modules.breach_db:breach_db_module",
+        query_types=frozenset({"email", "username"})
+    ),
+    ModuleSpec(
+        "github", "app.services.modules.github:github_module",
+        query_types=frozenset({"username", "email"})
+    ),
+    ModuleSpec(
+        "paste", "app.services.modules.paste_sites:paste_sites_module",
+        query_types=frozenset({"email", "username", "domain"}),
+        cost=COST_LOCAL
+    ),
+    ModuleSpec(
+        "news", "app.services.modules.news_forum:news_forum_module",
+        cost=COST_LOCAL
+    ),
+)
+
+
+class ModuleRegistry:
+    """
+    Registered module specs in registration order. Specs are cheap to hold;
+    a module's code (and its heavy dependencies) is imported by load().
+    """
+
+    def __init__(self, specs=BUILTIN_MODULES, entry_point_group: Optional[str] = ENTRY_POINT_GROUP):
+        self._specs: Dict[str, ModuleSpec] = {}
+        self._loaded: Dict[str, ModuleFunc] = {}
+        self._entry_point_group = entry_point_group
+        self._discovered = entry_point_group is None
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: ModuleSpec) -> None:
+        if spec.name in self._specs:
+            raise ValueError(f"OSINT module {spec.name!r} is already registered")
+        self._specs[spec.name] = spec
+
+    def _discover(self) -> None:
+        """Register specs advertised by installed packages (once)"""
+        if self._discovered:
+            return
+        self._discovered = True
+        for entry_point in entry_points(group=self._entry_point_group):
+            try:
+                spec = entry_point.load()
+                if not isinstance(spec, ModuleSpec):
+                    raise TypeError(f"expected ModuleSpec, got {type(spec).__name__}")
+                self.register(spec)
+            except Exception:
+                logger.exception("Ignoring OSINT module entry point %s", entry_point.name)
+
+    def specs(self) -> List[ModuleSpec]:
+        self._discover()
+        return list(self._specs.values())
+
+    def get(self, name: str) -> Optional[ModuleSpec]:
+        self._discover()
+        return self._specs.get(name)
+
+    def applicable(self, query_type: str, disabled=()) -> List[ModuleSpec]:
+        """Specs that would run for `query_type`, in scheduling order"""
+        return sorted(
+            (
+                spec for spec in self.specs()
+                if spec.name not in disabled and spec.applies_to(query_type) and not spec.missing_dependencies()
+            ),
+            key=lambda spec: COST_ORDER.get(spec.cost, len(COST_ORDER))
+        )
+
+    def load(self, name: str) -> ModuleFunc:
+        """The module's coroutine function, importing it on first use"""
+        func = self._loaded.get(name)
+        if func is None:
+            func = self._loaded[name] = _resolve(self._specs[name].target)
+        return func
+
+    def loaded(self) -> List[str]:
+        return list(self._loaded)
+
+    def shutdown(self) -> None:
+        """Run shutdown hooks of modules that were actually loaded"""
+        for name in self._loaded:
+            spec = self._specs[name]
+            if spec.shutdown:
+                try:
+                    _resolve(spec.shutdown)()
+                except Exception:
+                    logger.exception("Shutdown hook of OSINT module %s failed", name)
+
+
+# Global instance
+module_registry = ModuleRegistry()
@@ -2,63 +2,55 @@
 Search Engine Module - Simulates public search engine queries
 """
 
-import asyncio
 import httpx
 from typing import List, Dict, Any
 from datetime import datetime
 from urllib.parse import quote
 
-async def search_engine_module(query_type: str, query_value: str) -> List[Dict[str, Any]]:
+async def search_engine_module(
+    query_type: str,
+    query_value: str,
+    client: httpx.AsyncClient
+) -> List[Dict[str, Any]]:
     """Search engine public information gathering"""
     results = []
     
-    # Rate limiting - be respectful
-    await asyncio.sleep(0.5)
+    # Simulate search engine queries (using DuckDuckGo API as it's public)
+    search_query = f"{query_type}:{query_value}"
     
-    try:
-        # Simulate search engine queries (using DuckDuckGo API as it's public)
-        search_query = f"{query_type}:{query_value}"
-        
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # DuckDuckGo Instant Answer API (public, no auth required)
-            url = f"https://api.duckduckgo.com/?q={quote(search_query)}&format=json&no_html=1"
-            
-            try:
-                response = await client.get(url)
-                if response.status_code == 200:
-                    data = response.json()
-                    
-                    if data.get("AbstractText"):
-                        results.append({
-                            "source": "search_engine",
-                            "data": {
-                                "description": data.get("AbstractText", ""),
-                                "title": data.get("Heading", ""),
-                                "url": data.get("AbstractURL", "")
-                            },
-                            "confidence": "MEDIUM",
-                            "timestamp": datetime.utcnow().isoformat(),
-                            "url": data.get("AbstractURL")
-                        })
-            except Exception:
-                pass  # Fail silently for rate limiting
-            
-            # Additional search simulation (generic web search pattern)
-            # Note: In production, you'd use proper search APIs with rate limiting
-            results.append({
-                "source": "search_engine",
-                "data": {
-                    "description": f"Public search results for {query_type}: {query_value}",
-                    "query": search_query,
-                    "note": "This is a simulated search result. Actual implementation would use proper search APIs."
-                },
-                "confidence": "LOW",
-                "timestamp": datetime.utcnow().isoformat()
-            })
+    # DuckDuckGo Instant Answer API (public, no auth required). Failures,
+    # including rate limiting, propagate so the module reports them
+    url = f"https://api.duckduckgo.com/?q={quote(search_query)}&format=json&no_html=1"
     
-    except Exception as e:
-        # Fail gracefully
-        pass
+    response = await client.get(url)
+    response.raise_for_status()
+    data = response.json()
+    
+    if data.get("AbstractText"):
+        results.append({
+            "source": "search_engine",
+            "data": {
+                "description": data.get("AbstractText", ""),
+                "title": data.get("Heading", ""),
+                "url": data.get("AbstractURL", "")
+            },
+            "confidence": "MEDIUM",
+            "timestamp": datetime.utcnow().isoformat(),
+            "url": data.get("AbstractURL")
+        })
+    
+    # Additional search simulation (generic web search pattern)
+    # Note: In production, you'd use proper search APIs with rate limiting
+    results.append({
+        "source": "search_engine",
+        "data": {
+            "description": f"Public search results for {query_type}: {query_value}",
+            "query": search_query,
+            "note": "This is a simulated search result. Actual implementation would use proper search APIs."
+        },
+        "confidence": "LOW",
+        "timestamp": datetime.utcnow().isoformat(),
+        "simulated": True
+    })
     
     return results
-
@@ -4,55 +4,91 @@ Social Media Module - Public profile information
 
 import asyncio
 import httpx
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
-from urllib.parse import quote
 
-async def social_media_module(query_type: str, query_value: str) -> List[Dict[str, Any]]:
+from app.core.config import settings
+from app.services.modules.platforms import Platform, load_platforms
+
+async def _profile_exists(
+    client: httpx.AsyncClient,
+    platform: Platform,
+    username: str
+) -> bool:
+    """Apply the platform's existence heuristic to a single probe"""
+    follow_redirects = platform.check == "message"
+    response = await client.request(
+        platform.request_method,
+        platform.request_url(username),
+        follow_redirects=follow_redirects,
+        timeout=settings.SOCIAL_MEDIA_TIMEOUT
+    )
+
+    if platform.check == "message":
+        if response.status_code >= 400:
+            return False
+        body = response.text
+        return not any(text in body for text in platform.absent_text)
+
+    # status_code / response_url: any redirect means the profile is absent
+    return 200 <= response.status_code < 300
+
+async def _probe(
+    client: httpx.AsyncClient,
+    semaphore: asyncio.Semaphore,
+    platform: Platform,
+    username: str
+) -> Optional[Dict[str, Any]]:
+    async with semaphore:
+        exists = await _profile_exists(client, platform, username)
+
+    if not exists:
+        return None
+
+    profile_url = platform.profile_url(username)
+    return {
+        "source": "social_media",
+        "data": {
+            "platform": platform.name,
+            "category": platform.category,
+            "username": username,
+            "profile_url": profile_url,
+            "status": "Profile exists (public check)",
+            "note": "Only public profile existence verified. No private data accessed."
+        },
+        "confidence": "MEDIUM",
+        "timestamp": datetime.utcnow().isoformat(),
+        "url": profile_url
+    }
+
+async def social_media_module(
+    query_type: str,
+    query_value: str,
+    client: httpx.AsyncClient
+) -> List[Dict[str, Any]]:
     """Gather public social media profile information"""
-    results = []
-    
-    if query_type not in ["username", "email"]:
-        return results
-    
-    # Rate limiting
-    await asyncio.sleep(0.3)
-    
-    # Simulate checking public profiles (no login, no bypass)
-    # In production, you'd use public APIs or scrape public pages only
-    
-    social_platforms = [
-        {"name": "GitHub", "url": f"https://github.com/{quote(query_value)}"},
-        {"name": "Twitter", "url": f"https://twitter.com/{quote(query_value)}"},
-        {"name": "LinkedIn", "url": f"https://www.linkedin.com/in/{quote(query_value)}"},
-        {"name": "Instagram", "url": f"https://www.instagram.com/{quote(query_value)}"},
+    # Platforms are keyed by username; probing them with an email address
+    # only fires hundreds of requests for profiles that cannot exist
+    if query_type != "username":
+        return []
+
+    # Only public profile existence is checked (no login, no bypass). All
+    # applicable platforms are probed at once, capped by the semaphore here
+    # and by the shared client's per-host limits and rate limiter.
+    semaphore = asyncio.Semaphore(settings.SOCIAL_MEDIA_MAX_CONCURRENCY)
+    probes = [
+        _probe(client, semaphore, platform, query_value)
+        for platform in load_platforms()
+        if platform.accepts(query_value)
     ]
-    
-    async with httpx.AsyncClient(timeout=5.0, follow_redirects=True) as client:
-        for platform in social_platforms:
-            try:
-                # Check if profile exists (public check only)
-                response = await client.head(platform["url"], allow_redirects=True)
-                
-                if response.status_code == 200:
-                    results.append({
-                        "source": "social_media",
-                        "data": {
-                            "platform": platform["name"],
-                            "username": query_value,
-                            "profile_url": platform["url"],
-                            "status": "Profile exists (public check)",
-                            "note": "Only public profile existence verified. No private data accessed."
-                        },
-                        "confidence": "MEDIUM",
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "url": platform["url"]
-                    })
-                
-                await asyncio.sleep(0.2)  # Rate limiting
-                
-            except Exception:
-                continue
-    
-    return results
 
+    found = await asyncio.gather(*probes, return_exceptions=True)
+    errors = [result for result in found if isinstance(result, BaseException)]
+    for error in errors:
+        if not isinstance(error, httpx.HTTPError):
+            raise error
+    # Individual sites blocking or timing out is routine; all of them failing
+    # means the network is at fault and the empty answer cannot be trusted
+    if errors and len(errors) == len(probes):
+        raise errors[0]
+    return [result for result in found if isinstance(result, dict)]
@@ -3,101 +3,170 @@ WHOIS & DNS Module - Domain and IP information
 """
 
 import asyncio
+import httpx
+import dns.asyncresolver
 import dns.resolver
 import whois
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from datetime import datetime
 import re
 
-async def whois_dns_module(query_type: str, query_value: str) -> List[Dict[str, Any]]:
+from app.core.config import settings
+from app.services.rate_limiter import rate_limiter
+
+DNS_RECORD_TYPES = ["A", "AAAA", "MX", "NS", "TXT", "SOA", "CNAME", "CAA"]
+
+# python-whois is blocking socket I/O; it runs on its own small pool so a slow
+# registrar can neither freeze the event loop nor exhaust the default executor
+_whois_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_whois_executor() -> ThreadPoolExecutor:
+    global _whois_executor
+    if _whois_executor is None:
+        _whois_executor = ThreadPoolExecutor(
+            max_workers=settings.WHOIS_MAX_WORKERS,
+            thread_name_prefix="whois"
+        )
+    return _whois_executor
+
+def shutdown_whois_executor() -> None:
+    """Stop the WHOIS pool without waiting on lookups still in flight"""
+    global _whois_executor
+    if _whois_executor is not None:
+        _whois_executor.shutdown(wait=False, cancel_futures=True)
+        _whois_executor = None
+
+def _first(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return str(value) if value else None
+
+async def _whois_lookup(domain: str) -> Optional[Dict[str, Any]]:
+    loop = asyncio.get_running_loop()
+    try:
+        await rate_limiter.acquire("whois")
+        w = await asyncio.wait_for(
+            loop.run_in_executor(_get_whois_executor(), whois.whois, domain),
+            timeout=settings.WHOIS_TIMEOUT
+        )
+    except (asyncio.TimeoutError, OSError):
+        # The registrar could not be reached: a failure, not a missing record
+        raise
+    except Exception:
+        # No record, or a reply the parser cannot read
+        return None
+
+    return {
+        "domain": domain,
+        "registrar": w.registrar if hasattr(w, 'registrar') else None,
+        "creation_date": _first(w.creation_date),
+        "expiration_date": _first(w.expiration_date),
+        "name_servers": list(w.name_servers) if w.name_servers else [],
+        "status": list(w.status) if isinstance(w.status, list) else [w.status] if w.status else []
+    }
+
+def _make_resolver() -> dns.asyncresolver.Resolver:
+    resolver = dns.asyncresolver.Resolver()
+    resolver.lifetime = settings.DNS_TIMEOUT
+    return resolver
+
+async def _resolve(
+    resolver: dns.asyncresolver.Resolver,
+    domain: str,
+    record_type: str
+) -> List[str]:
+    try:
+        answers = await resolver.resolve(domain, record_type)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+        # Timeouts and unreachable servers propagate as module failures
+        return []
+    return [str(rdata) for rdata in answers]
+
+async def _dns_lookup(domain: str) -> Dict[str, List[str]]:
+    """Resolve every record type concurrently; empty types are dropped"""
+    resolver = _make_resolver()
+    answers = await asyncio.gather(
+        *(_resolve(resolver, domain, record_type) for record_type in DNS_RECORD_TYPES)
+    )
+    return {
+        record_type: records
+        for record_type, records in zip(DNS_RECORD_TYPES, answers)
+        if records
+    }
+
+async def _reverse_lookup(ip: str) -> List[str]:
+    try:
+        answers = await _make_resolver().resolve_address(ip)
+    except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, ValueError):
+        return []
+    return [str(rdata) for rdata in answers]
+
+async def whois_dns_module(
+    query_type: str,
+    query_value: str,
+    client: httpx.AsyncClient
+) -> List[Dict[str, Any]]:
     """Gather WHOIS and DNS information"""
     results = []
-    
+
     if query_type not in ["domain", "ip"]:
         return results
-    
-    try:
-        # WHOIS lookup
-        if query_type == "domain":
-            domain = query_value.lower().replace("http://", "").replace("https://", "").replace("www.", "")
-            domain = domain.split("/")[0]
-            
-            try:
-                w = whois.whois(domain)
-                
-                whois_data = {
+
+    if query_type == "domain":
+        domain = query_value.lower().replace("http://", "").replace("https://", "").replace("www.", "")
+        domain = domain.split("/")[0]
+
+        # WHOIS and DNS lookups run side by side
+        whois_data, dns_results = await asyncio.gather(
+            _whois_lookup(domain),
+            _dns_lookup(domain)
+        )
+
+        if whois_data:
+            results.append({
+                "source": "whois",
+                "data": whois_data,
+                "confidence": "HIGH",
+                "timestamp": datetime.utcnow().isoformat()
+            })
+
+        if dns_results:
+            results.append({
+                "source": "dns",
+                "data": {
                     "domain": domain,
-                    "registrar": w.registrar if hasattr(w, 'registrar') else None,
-                    "creation_date": str(w.creation_date[0]) if isinstance(w.creation_date, list) else str(w.creation_date) if w.creation_date else None,
-                    "expiration_date": str(w.expiration_date[0]) if isinstance(w.expiration_date, list) else str(w.expiration_date) if w.expiration_date else None,
-                    "name_servers": list(w.name_servers) if w.name_servers else [],
-                    "status": list(w.status) if isinstance(w.status, list) else [w.status] if w.status else []
-                }
-                
-                results.append({
-                    "source": "whois",
-                    "data": whois_data,
-                    "confidence": "HIGH",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-            except Exception:
-                pass
-            
-            # DNS records
-            try:
-                dns_results = {}
-                
-                # A record
-                try:
-                    answers = dns.resolver.resolve(domain, 'A')
-                    dns_results["A"] = [str(rdata) for rdata in answers]
-                except:
-                    pass
-                
-                # MX record
-                try:
-                    answers = dns.resolver.resolve(domain, 'MX')
-                    dns_results["MX"] = [str(rdata) for rdata in answers]
-                except:
-                    pass
-                
-                # NS record
-                try:
-                    answers = dns.resolver.resolve(domain, 'NS')
-                    dns_results["NS"] = [str(rdata) for rdata in answers]
-                except:
-                    pass
-                
-                if dns_results:
-                    results.append({
-                        "source": "dns",
-                        "data": {
-                            "domain": domain,
-                            "records": dns_results
-                        },
-                        "confidence": "HIGH",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-            except Exception:
-                pass
-        
-        # IP information (basic)
-        elif query_type == "ip":
-            # Basic IP validation
-            ip_pattern = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
-            if ip_pattern.match(query_value):
+                    "records": dns_results
+                },
+                "confidence": "HIGH",
+                "timestamp": datetime.utcnow().isoformat()
+            })
+
+    # IP information (basic)
+    elif query_type == "ip":
+        # Basic IP validation
+        ip_pattern = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+        if ip_pattern.match(query_value):
+            results.append({
+                "source": "ip_lookup",
+                "data": {
+                    "ip": query_value,
+                    "note": "IP address detected. For detailed geolocation, use proper IP geolocation APIs."
+                },
+                "confidence": "MEDIUM",
+                "timestamp": datetime.utcnow().isoformat()
+            })
+
+            ptr_records = await _reverse_lookup(query_value)
+            if ptr_records:
                 results.append({
-                    "source": "ip_lookup",
+                    "source": "dns",
                     "data": {
                         "ip": query_value,
-                        "note": "IP address detected. For detailed geolocation, use proper IP geolocation APIs."
+                        "records": {"PTR": ptr_records}
                     },
-                    "confidence": "MEDIUM",
+                    "confidence": "HIGH",
                     "timestamp": datetime.utcnow().isoformat()
                 })
-    
-    except Exception as e:
-        pass
-    
-    return results
 
+    return results
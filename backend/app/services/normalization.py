@@ -0,0 +1,29 @@
+"""
+Indicator normalization - canonical form of query values for keys and dedupe
+"""
+
+import re
+
+_CASE_INSENSITIVE_TYPES = {"username", "email", "domain", "company"}
+
+def normalize_query_value(query_type: str, query_value: str) -> str:
+    """
+    Canonical form of an indicator, so "Example.COM/" and "example.com"
+    share cache entries, dedupe and pivots.
+    """
+    value = query_value.strip()
+
+    if query_type == "domain":
+        value = re.sub(r"^[a-zA-Z][a-zA-Z0-9+.-]*://", "", value)
+        value = value.split("/")[0].rstrip(".")
+        if value.lower().startswith("www."):
+            value = value[4:]
+    elif query_type == "phone":
+        value = ("+" if value.startswith("+") else "") + re.sub(r"\D", "", value)
+    elif query_type == "company":
+        value = " ".join(value.split())
+
+    if query_type in _CASE_INSENSITIVE_TYPES:
+        value = value.lower()
+
+    return value
@@ -2,66 +2,326 @@
 OSINT Engine - Core intelligence gathering service
 """
 
-from typing import Dict, List, Any
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import asyncio
+import logging
+import time
+import httpx
 
-from app.services.modules import (
-    search_engine_module,
-    social_media_module,
-    whois_dns_module,
-    breach_db_module,
-    github_module,
-    paste_sites_module,
-    news_forum_module
-)
+from app.core.config import settings
+from app.services.http_client import create_http_client
+from app.services.normalization import normalize_query_value
+from app.services.result_cache import result_cache
+from app.services.correlation import correlate
+from app.services.result_filter import filter_results, signal_results
+from app.services.modules import ModuleRegistry, ModuleSpec, module_registry
+
+logger = logging.getLogger(__name__)
+
+# Indicator types accepted by the engine
+QUERY_TYPES = ["username", "email", "phone", "domain", "ip", "company"]
+
+# Per-module outcome recorded in every analysis
+MODULE_OK = "ok"
+MODULE_TIMEOUT = "timeout"
+MODULE_ERROR = "error"
+MODULE_SKIPPED = "skipped"
+
+class _Flight:
+    """
+    One in-flight analysis shared by every caller asking for the same
+    indicator. Events are kept so callers that join late replay them.
+    """
+    
+    def __init__(self):
+        self.events: List[Dict[str, Any]] = []
+        self.subscribers = 0
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+    
+    def _notify(self) -> None:
+        wakeup, self._wakeup = self._wakeup, asyncio.Event()
+        wakeup.set()
+    
+    def publish(self, event: Dict[str, Any]) -> None:
+        self.events.append(event)
+        self._notify()
+    
+    def finish(self) -> None:
+        self.done = True
+        self._notify()
+    
+    async def follow(self) -> AsyncIterator[Dict[str, Any]]:
+        index = 0
+        while True:
+            if index < len(self.events):
+                yield self.events[index]
+                index += 1
+                continue
+            if self.done:
+                if self.error is not None:
+                    raise self.error
+                return
+            await self._wakeup.wait()
 
 class OSINTEngine:
     """Main OSINT analysis engine"""
     
-    def __init__(self):
-        self.modules = {
-            "search": search_engine_module,
-            "social": social_media_module,
-            "whois_dns": whois_dns_module,
-            "breach": breach_db_module,
-            "github": github_module,
-            "paste": paste_sites_module,
-            "news": news_forum_module
-        }
+    def __init__(self, registry: ModuleRegistry = module_registry):
+        # Module declarations; each module's code is imported on first use
+        self.registry = registry
+        # Pooled client shared by all modules; attached by the app lifespan
+        self.http_client: Optional[httpx.AsyncClient] = None
+        # Running analyses by (query_type, normalized value)
+        self._flights: Dict[Tuple[str, str], _Flight] = {}
+    
+    def attach_http_client(self, client: Optional[httpx.AsyncClient]) -> None:
+        """Set (or clear) the shared HTTP client handed to every module"""
+        self.http_client = client
+    
+    def scheduled_modules(self, query_type: str) -> List[ModuleSpec]:
+        """Modules that will run for a query of this type, in start order"""
+        return self.registry.applicable(query_type, settings.OSINT_DISABLED_MODULES)
+    
+    def _skip_reason(self, spec: ModuleSpec, query_type: str) -> str:
+        if spec.name in settings.OSINT_DISABLED_MODULES:
+            return "Disabled by configuration"
+        if not spec.applies_to(query_type):
+            return f"Not applicable to {query_type} queries"
+        missing = spec.missing_dependencies()
+        if missing:
+            return f"Missing dependencies: {', '.join(missing)}"
+        return "Not scheduled"
     
     async def analyze(self, query_type: str, query_value: str) -> Dict[str, Any]:
         """
         Main analysis function
         Returns structured results with risk scoring
         """
-        results = []
+        result = None
+        async for event in self.analyze_stream(query_type, query_value):
+            if event["event"] == "analysis":
+                result = event["result"]
+        return result
+    
+    async def analyze_stream(
+        self,
+        query_type: str,
+        query_value: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Streaming variant of analyze().
+        Yields a "module" event (results, status, elapsed_ms) as each module
+        finishes or times out, then a final "analysis" event whose "result"
+        is what analyze() returns. The whole query is bounded by
+        OSINT_QUERY_DEADLINE; modules still running then are cancelled.
         
-        # Run all modules in parallel
-        tasks = []
-        for module_name, module_func in self.modules.items():
-            task = module_func(query_type, query_value)
-            tasks.append(task)
+        Concurrent calls for the same indicator share one execution: later
+        callers replay the events so far and follow the rest. Events are
+        shared between callers and must be treated as read-only; each caller
+        still persists its own query row.
+        """
+        if not settings.OSINT_COALESCE_QUERIES:
+            async for event in self._collect(query_type, query_value):
+                yield event
+            return
         
-        module_results = await asyncio.gather(*tasks, return_exceptions=True)
+        key = (query_type, normalize_query_value(query_type, query_value))
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight()
+            flight.task = asyncio.create_task(self._fly(key, flight, query_type, query_value))
+        else:
+            logger.debug("Joining in-flight %s analysis of %r", query_type, key[1])
         
-        # Process results
-        for module_name, module_result in zip(self.modules.keys(), module_results):
-            if isinstance(module_result, Exception):
-                continue
-            if module_result:
-                results.extend(module_result)
+        flight.subscribers += 1
+        try:
+            async for event in flight.follow():
+                yield event
+        finally:
+            flight.subscribers -= 1
+            if not flight.subscribers and not flight.done:
+                # Every caller went away (e.g. clients disconnected): stop it
+                self._land(key, flight)
+                flight.task.cancel()
+    
+    def _land(self, key: Tuple[str, str], flight: _Flight) -> None:
+        """Stop routing new callers to `flight`"""
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+    
+    async def _fly(
+        self,
+        key: Tuple[str, str],
+        flight: _Flight,
+        query_type: str,
+        query_value: str
+    ) -> None:
+        try:
+            async for event in self._collect(query_type, query_value):
+                flight.publish(event)
+        except asyncio.CancelledError as e:
+            flight.error = e
+            raise
+        except Exception as e:
+            # Re-raised to every caller, which handles it as its own failure
+            flight.error = e
+        finally:
+            # Callers arriving from now on start a fresh analysis
+            self._land(key, flight)
+            flight.finish()
+    
+    async def _collect(
+        self,
+        query_type: str,
+        query_value: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """One uncoalesced run of the analysis, on the shared client when attached"""
+        if self.http_client is None:
+            # Used outside the app lifespan (scripts, shell): short-lived pool
+            async with create_http_client() as client:
+                async for event in self._analyze_stream(query_type, query_value, client):
+                    yield event
+        else:
+            async for event in self._analyze_stream(query_type, query_value, self.http_client):
+                yield event
+    
+    async def _analyze_stream(
+        self,
+        query_type: str,
+        query_value: str,
+        client: httpx.AsyncClient
+    ) -> AsyncIterator[Dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.OSINT_QUERY_DEADLINE
+        module_results: Dict[str, List[Dict[str, Any]]] = {}
+        module_status: Dict[str, Dict[str, Any]] = {}
+        
+        specs = self.registry.specs()
+        scheduled = self.scheduled_modules(query_type)
+        scheduled_names = {spec.name for spec in scheduled}
+        for spec in specs:
+            if spec.name not in scheduled_names:
+                module_status[spec.name] = {
+                    "status": MODULE_SKIPPED,
+                    "elapsed_ms": 0,
+                    "findings": 0,
+                    "reason": self._skip_reason(spec, query_type)
+                }
+        
+        # Run the applicable modules in parallel
+        tasks = {}
+        for spec in scheduled:
+            task = asyncio.create_task(
+                self._run_module(spec.name, query_type, query_value, client)
+            )
+            tasks[task] = spec.name
+        
+        pending = set(tasks)
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    module_name = tasks[task]
+                    results, status = task.result()
+                    module_results[module_name] = results
+                    module_status[module_name] = status
+                    yield {"event": "module", "module": module_name, "results": results, **status}
+            
+            # Query deadline hit: whatever is still running is a timeout
+            for task in pending:
+                task.cancel()
+                module_name = tasks[task]
+                module_status[module_name] = {
+                    "status": MODULE_TIMEOUT,
+                    "elapsed_ms": int(settings.OSINT_QUERY_DEADLINE * 1000),
+                    "findings": 0,
+                    "error": "Query deadline exceeded"
+                }
+                yield {"event": "module", "module": module_name, "results": [], **module_status[module_name]}
+        finally:
+            # Consumer went away (e.g. client disconnected): stop stragglers
+            for task in pending:
+                task.cancel()
+        
+        # Keep module order stable regardless of completion order
+        results = []
+        for spec in specs:
+            results.extend(module_results.get(spec.name, []))
+        
+        # Dedupe and drop placeholders before anything is analyzed or stored
+        results, filtering = filter_results(results)
         
         # Analyze and correlate
-        analysis = self._analyze_results(results, query_type, query_value)
+        analysis = self._analyze_results(signal_results(results), query_type, query_value)
+        analysis["filtering"] = filtering
         
-        return {
-            "results": results,
-            "analysis": analysis,
-            "risk_score": analysis.get("risk_score", "LOW"),
-            "timestamp": datetime.utcnow().isoformat()
+        yield {
+            "event": "analysis",
+            "result": {
+                "results": results,
+                "analysis": analysis,
+                "modules": {spec.name: module_status[spec.name] for spec in specs if spec.name in module_status},
+                "risk_score": analysis.get("risk_score", "LOW"),
+                "timestamp": datetime.utcnow().isoformat()
+            }
         }
     
+    async def _run_module(
+        self,
+        module_name: str,
+        query_type: str,
+        query_value: str,
+        client: httpx.AsyncClient
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Run one module under its own timeout, served from the result cache
+        when possible; the module is imported only on a cache miss, and only
+        runs that succeed are stored. Never raises; returns (results, status
+        record).
+        """
+        started = time.monotonic()
+        status: Dict[str, Any] = {"status": MODULE_OK}
+        results: List[Dict[str, Any]] = []
+        
+        cached = await result_cache.get(module_name, query_type, query_value)
+        if cached is not None:
+            results = cached
+            status["cached"] = True
+        else:
+            timeout = settings.OSINT_MODULE_TIMEOUTS.get(module_name, settings.OSINT_MODULE_TIMEOUT)
+            try:
+                module_func = self.registry.load(module_name)
+                results = await asyncio.wait_for(
+                    module_func(query_type, query_value, client), timeout=timeout
+                ) or []
+            except asyncio.TimeoutError:
+                status = {"status": MODULE_TIMEOUT, "error": f"Module timed out after {timeout}s"}
+            except httpx.TimeoutException as e:
+                status = {"status": MODULE_TIMEOUT, "error": f"{type(e).__name__}: {e}"}
+            except httpx.HTTPError as e:
+                # Upstream failure (unreachable, rate limited, 5xx): expected, no traceback
+                logger.warning("OSINT module %s failed: %s", module_name, e)
+                status = {"status": MODULE_ERROR, "error": f"{type(e).__name__}: {e}"}
+            except Exception as e:
+                logger.exception("OSINT module %s failed", module_name)
+                status = {"status": MODULE_ERROR, "error": f"{type(e).__name__}: {e}"}
+            # A failed run says nothing about the indicator, so it is never cached
+            if status["status"] == MODULE_OK:
+                await result_cache.set(module_name, query_type, query_value, results)
+        
+        status["elapsed_ms"] = int((time.monotonic() - started) * 1000)
+        status["findings"] = len(results)
+        return results, status
+    
     def _analyze_results(
         self, 
         results: List[Dict[str, Any]], 
@@ -69,63 +329,7 @@ class OSINTEngine:
         query_value: str
     ) -> Dict[str, Any]:
         """Analyze and correlate results"""
-        analysis = {
-            "total_sources": len(set(r.get("source") for r in results)),
-            "total_findings": len(results),
-            "patterns": [],
-            "timeline": [],
-            "risk_score": "LOW"
-        }
-        
-        # Pattern detection
-        usernames = set()
-        emails = set()
-        domains = set()
-        
-        for result in results:
-            data = result.get("data", {})
-            if "username" in data:
-                usernames.add(data["username"])
-            if "email" in data:
-                emails.add(data["email"])
-            if "domain" in data:
-                domains.add(data["domain"])
-        
-        if len(usernames) > 1:
-            analysis["patterns"].append({
-                "type": "username_reuse",
-                "description": f"Username found across {len(usernames)} different platforms",
-                "usernames": list(usernames)
-            })
-        
-        # Timeline creation
-        for result in results:
-            if "timestamp" in result:
-                analysis["timeline"].append({
-                    "date": result["timestamp"],
-                    "source": result.get("source"),
-                    "event": result.get("data", {}).get("description", "Activity detected")
-                })
-        
-        analysis["timeline"].sort(key=lambda x: x["date"])
-        
-        # Risk scoring (informational only)
-        risk_factors = 0
-        if len(results) > 10:
-            risk_factors += 1
-        if len(emails) > 0:
-            risk_factors += 1
-        if len(domains) > 1:
-            risk_factors += 1
-        
-        if risk_factors >= 2:
-            analysis["risk_score"] = "HIGH"
-        elif risk_factors == 1:
-            analysis["risk_score"] = "MEDIUM"
-        else:
-            analysis["risk_score"] = "LOW"
-        
-        return analysis
+        return correlate(results)
 
 # Global instance
 osint_engine = OSINTEngine()
@@ -0,0 +1,63 @@
+"""
+Keyset pagination - opaque cursors over (created_at, id) and other sort keys
+"""
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlalchemy import String, and_, literal, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+Cursor = Tuple[datetime, int]
+
+class InvalidCursor(ValueError):
+    """Raised when a client-supplied cursor cannot be decoded"""
+
+def encode_token(values: List[Any]) -> str:
+    """Opaque, URL-safe cursor for a list of JSON-serializable values"""
+    raw = json.dumps(values, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_token(cursor: str) -> List[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise InvalidCursor("Invalid cursor")
+    if not isinstance(values, list):
+        raise InvalidCursor("Invalid cursor")
+    return values
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    return encode_token([created_at.isoformat(), row_id])
+
+def decode_cursor(cursor: str) -> Cursor:
+    try:
+        created_at, row_id = decode_token(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+def _timestamp_param(db: AsyncSession, value: datetime) -> Any:
+    # SQLite keeps timestamps as text and CURRENT_TIMESTAMP defaults carry no
+    # fractional part, while SQLAlchemy binds "...SS.ffffff". Compare against
+    # the stored representation so rows on the cursor's second aren't repeated.
+    if db.bind.dialect.name == "sqlite":
+        text = value.strftime("%Y-%m-%d %H:%M:%S")
+        if value.microsecond:
+            text += f".{value.microsecond:06d}"
+        return literal(text, String)
+    return value
+
+def before_cursor(db: AsyncSession, created_col, id_col, cursor: Optional[str]):
+    """
+    WHERE clause selecting rows strictly after `cursor` in
+    (created_at DESC, id DESC) order, or None for the first page.
+    """
+    if not cursor:
+        return None
+    created_at, row_id = decode_cursor(cursor)
+    param = _timestamp_param(db, created_at)
+    return or_(created_col < param, and_(created_col == param, id_col < row_id))
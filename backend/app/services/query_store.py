@@ -0,0 +1,39 @@
+"""
+Query persistence - saving finished analyses
+"""
+
+from typing import Any, Dict, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import OSINTQuery
+from app.services.findings import build_findings
+from app.services.entity_index import build_occurrences
+from app.services.timelines import build_timeline
+
+async def save_query(
+    db: AsyncSession,
+    user_id: int,
+    query_type: str,
+    query_value: str,
+    analysis_result: Dict[str, Any],
+    case_id: Optional[int] = None
+) -> OSINTQuery:
+    """Persist a finished analysis as an OSINTQuery row plus its findings, entity index entries and timeline"""
+    db_query = OSINTQuery(
+        user_id=user_id,
+        query_type=query_type,
+        query_value=query_value,
+        results=analysis_result,
+        risk_score=analysis_result.get("risk_score", "LOW"),
+        case_id=case_id
+    )
+    db.add(db_query)
+    await db.flush()
+    findings = build_findings(db_query)
+    db.add_all(findings)
+    await db.flush()
+    db.add_all(build_occurrences(db_query, findings))
+    db.add_all(build_timeline(db_query, findings))
+    await db.commit()
+    await db.refresh(db_query)
+    return db_query
@@ -0,0 +1,88 @@
+"""
+Rate limiting - per-host token buckets shared by every OSINT module
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `burst`.
+    Callers reserve a token up front and sleep off any debt, so waiters are
+    served in arrival order without a lock. A waiter cancelled before its
+    turn (module timeout, query deadline) hands its token back.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                # Otherwise every abandoned waiter leaves the bucket deeper in debt
+                self._tokens += 1
+                raise
+
+
+class RateLimiter:
+    """Token buckets keyed by destination host, configured from Settings"""
+
+    def __init__(
+        self,
+        default_rate: float,
+        default_burst: int,
+        host_limits: Optional[Dict[str, Dict[str, float]]] = None
+    ):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = host_limits or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            limits = self.host_limits.get(host, {})
+            bucket = TokenBucket(
+                rate=limits.get("rate", self.default_rate),
+                burst=int(limits.get("burst", self.default_burst))
+            )
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, host: str) -> None:
+        """Wait until a request to `host` is allowed"""
+        await self._bucket(host.lower()).acquire()
+
+    async def on_request(self, request: httpx.Request) -> None:
+        """httpx request event hook - throttles every outbound request by host"""
+        await self.acquire(request.url.host)
+
+
+# Global instance
+rate_limiter = RateLimiter(
+    default_rate=settings.RATE_LIMIT_DEFAULT_RATE,
+    default_burst=settings.RATE_LIMIT_DEFAULT_BURST,
+    host_limits=settings.RATE_LIMIT_HOSTS
+)
@@ -0,0 +1,255 @@
+"""
+Report cache - content-addressed on-disk store for generated report files
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Bump when report layout changes so stale artifacts stop matching
+REPORT_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class CachedReport:
+    path: str
+    etag: str
+    size: int
+
+
+def report_key(kind: str, subject: Any, content: Any) -> str:
+    """
+    Cache key for a report: the report kind (e.g. "json", "pdf"), what it
+    is about (e.g. a query id) and a hash of everything it is built from.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{REPORT_FORMAT_VERSION}:{kind}:{subject}:".encode())
+    digest.update(json.dumps(content, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:32]
+
+
+class ReportCache:
+    """
+    Generated reports stored as `<key>.<content digest><suffix>` files. The
+    content digest doubles as a strong ETag. Least recently served files are
+    deleted once the directory grows past `max_bytes`.
+
+    Size and recency are tracked in process: workers sharing the directory
+    do not see each other's writes, so each enforces the bound only over
+    the files it knows about.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, stale_temp_age: float = 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.stale_temp_age = stale_temp_age
+        self.size = 0
+        self._entries: "OrderedDict[str, CachedReport]" = OrderedDict()
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
+        self._inflight: Dict[str, "asyncio.Future[CachedReport]"] = {}
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    def _scan(self) -> Dict[str, CachedReport]:
+        os.makedirs(self.directory, exist_ok=True)
+        found = []
+        now = time.time()
+        for entry in os.scandir(self.directory):
+            if not entry.is_file():
+                continue
+            stat = entry.stat()
+            if entry.name.startswith("tmp"):
+                # Left behind by a render that never finished; recent ones may
+                # belong to another worker still writing them
+                if now - stat.st_mtime > self.stale_temp_age:
+                    self._unlink(entry.path)
+                continue
+            parts = entry.name.split(".", 2)
+            if len(parts) != 3:
+                continue
+            found.append((stat.st_atime, parts[0], CachedReport(entry.path, f'"{parts[1]}"', stat.st_size)))
+        # Oldest first, so the OrderedDict starts out in LRU order
+        return {key: report for _, key, report in sorted(found)}
+
+    async def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            entries = await asyncio.to_thread(self._scan)
+            self._entries.update(entries)
+            self.size = sum(report.size for report in entries.values())
+            self._loaded = True
+
+    async def get(self, key: str) -> Optional[CachedReport]:
+        await self._ensure_loaded()
+        report = self._entries.get(key)
+        if report is None or not os.path.exists(report.path):
+            if report is not None:
+                self._forget(key)
+            self._stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return report
+
+    def temp_path(self, suffix: str) -> str:
+        """
+        A fresh path inside the cache directory for writing a report to.
+        Call after the cache is loaded: the initial scan removes stale temp files.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="tmp", suffix=suffix, dir=self.directory)
+        os.close(fd)
+        return path
+
+    async def commit(self, key: str, temp_path: str, suffix: str) -> CachedReport:
+        """Move a fully written report from `temp_path` into the cache"""
+        await self._ensure_loaded()
+
+        def finalize() -> CachedReport:
+            digest = _file_digest(temp_path)
+            path = os.path.join(self.directory, f"{key}.{digest}{suffix}")
+            os.replace(temp_path, path)
+            return CachedReport(path, f'"{digest}"', os.path.getsize(path))
+
+        report = await asyncio.to_thread(finalize)
+        previous = self._entries.get(key)
+        if previous is not None and previous.path != report.path:
+            await asyncio.to_thread(self._unlink, previous.path)
+        self._forget(key)
+        self._entries[key] = report
+        self.size += report.size
+        self._stats["stores"] += 1
+        await self._evict(keep=key)
+        return report
+
+    async def get_or_create(
+        self,
+        key: str,
+        suffix: str,
+        render: Callable[[str], Awaitable[None]]
+    ) -> CachedReport:
+        """
+        Return the cached report for `key`, or have `render` write it to a
+        temporary path and cache the result. Concurrent misses on the same
+        key share one render.
+        """
+        report = await self.get(key)
+        if report is not None:
+            return report
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._create(key, suffix, render))
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # One client disconnecting must not cancel the render for the others
+        return await asyncio.shield(flight)
+
+    async def _create(
+        self,
+        key: str,
+        suffix: str,
+        render: Callable[[str], Awaitable[None]]
+    ) -> CachedReport:
+        # The first scan sweeps stale temp files, so it must not run mid-render
+        await self._ensure_loaded()
+        temp_path = self.temp_path(suffix)
+        try:
+            await render(temp_path)
+        except BaseException:
+            await asyncio.to_thread(self._unlink, temp_path)
+            raise
+        return await self.commit(key, temp_path, suffix)
+
+    async def put(self, key: str, content: bytes, suffix: str) -> CachedReport:
+        async def write(path: str) -> None:
+            await asyncio.to_thread(self._write, path, content)
+
+        return await self._create(key, suffix, write)
+
+    @staticmethod
+    def _write(path: str, content: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(content)
+
+    @staticmethod
+    def _unlink(path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def _forget(self, key: str) -> None:
+        report = self._entries.pop(key, None)
+        if report is not None:
+            self.size -= report.size
+
+    async def _evict(self, keep: str) -> None:
+        victims = []
+        for key in list(self._entries):
+            if self.size <= self.max_bytes:
+                break
+            # Never evict the report that is about to be served
+            if key == keep:
+                continue
+            victims.append(self._entries[key].path)
+            self._forget(key)
+            self._stats["evictions"] += 1
+        for path in victims:
+            await asyncio.to_thread(self._unlink, path)
+
+    async def clear(self) -> None:
+        await self._ensure_loaded()
+        paths = [report.path for report in self._entries.values()]
+        self._entries.clear()
+        self.size = 0
+        for path in paths:
+            await asyncio.to_thread(self._unlink, path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._stats,
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes
+        }
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+# Global instance
+report_cache = ReportCache(
+    directory=settings.REPORT_CACHE_DIR,
+    max_bytes=settings.REPORT_CACHE_MAX_BYTES,
+    stale_temp_age=settings.REPORT_CACHE_STALE_TEMP_AGE
+)
@@ -3,14 +3,19 @@ Report generation service
 """
 
 from typing import Dict, Any
+import json
 from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, PageBreak
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
-from io import BytesIO
 from datetime import datetime
 
+DISCLAIMER = "This report contains only publicly available information. For educational, investigative, and defensive security purposes only."
+SOURCE_ATTRIBUTION = "All data points include source attribution. No private or unauthorized data accessed."
+
 def generate_json_report(query) -> Dict[str, Any]:
     """Generate structured JSON report"""
     return {
@@ -22,15 +27,25 @@ def generate_json_report(query) -> Dict[str, Any]:
             "created_at": query.created_at.isoformat() if query.created_at else None,
             "generated_at": datetime.utcnow().isoformat()
         },
-        "disclaimer": "This report contains only publicly available information. For educational, investigative, and defensive security purposes only.",
+        "disclaimer": DISCLAIMER,
         "results": query.results if query.results else {},
-        "source_attribution": "All data points include source attribution. No private or unauthorized data accessed."
+        "source_attribution": SOURCE_ATTRIBUTION
     }
 
-def generate_pdf_report(query) -> bytes:
-    """Generate PDF report"""
-    buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
+def report_snapshot(query) -> Dict[str, Any]:
+    """Plain copy of the query fields a report needs, safe to send to another process"""
+    return {
+        "id": query.id,
+        "query_type": query.query_type,
+        "query_value": query.query_value,
+        "risk_score": query.risk_score,
+        "created_at": query.created_at,
+        "results": query.results
+    }
+
+def write_pdf_report(snapshot: Dict[str, Any], path: str) -> None:
+    """Render a PDF report for a query snapshot straight to `path`"""
+    doc = SimpleDocTemplate(path, pagesize=letter)
     story = []
     
     styles = getSampleStyleSheet()
@@ -65,18 +80,18 @@ def generate_pdf_report(query) -> bytes:
     story.append(Spacer(1, 0.3*inch))
     
     # Query Information
-    story.append(Paragraph(f"<b>Query Type:</b> {query.query_type}", styles['Normal']))
-    story.append(Paragraph(f"<b>Query Value:</b> {query.query_value}", styles['Normal']))
-    story.append(Paragraph(f"<b>Risk Score:</b> {query.risk_score}", styles['Normal']))
-    story.append(Paragraph(f"<b>Created At:</b> {query.created_at}", styles['Normal']))
+    story.append(Paragraph(f"<b>Query Type:</b> {snapshot['query_type']}", styles['Normal']))
+    story.append(Paragraph(f"<b>Query Value:</b> {snapshot['query_value']}", styles['Normal']))
+    story.append(Paragraph(f"<b>Risk Score:</b> {snapshot['risk_score']}", styles['Normal']))
+    story.append(Paragraph(f"<b>Created At:</b> {snapshot['created_at']}", styles['Normal']))
     story.append(Spacer(1, 0.2*inch))
     
     # Results
-    if query.results:
+    if snapshot["results"]:
         story.append(Paragraph("<b>Investigation Results:</b>", styles['Heading2']))
         story.append(Spacer(1, 0.1*inch))
         
-        results = query.results
+        results = snapshot["results"]
         if isinstance(results, dict):
             if "results" in results:
                 for result in results.get("results", []):
@@ -93,6 +108,93 @@ def generate_pdf_report(query) -> bytes:
     ))
     
     doc.build(story)
-    buffer.seek(0)
-    return buffer.read()
+
+PDF_DISCLAIMER = (
+    "LEGAL DISCLAIMER: This report contains only publicly available information. "
+    "For educational, investigative, and defensive security purposes only. "
+    "No private or unauthorized data accessed."
+)
+
+class _CanvasWriter:
+    """
+    Top-to-bottom text layout on a raw canvas. reportlab keeps finished
+    pages until save(), so memory grows with the page count; only the
+    platypus story and the query snapshots are never held in full.
+    """
+
+    margin = 0.75 * inch
+
+    def __init__(self, path: str):
+        self.canvas = canvas.Canvas(path, pagesize=letter)
+        self.width, self.height = letter
+        self.page = 1
+        self.y = self.height - self.margin
+
+    def _footer(self) -> None:
+        self.canvas.setFont("Helvetica", 8)
+        self.canvas.setFillColor("#000000")
+        self.canvas.drawCentredString(
+            self.width / 2, self.margin / 2,
+            f"Report generated by OSINT Tool - Educational Use Only - Page {self.page}"
+        )
+
+    def new_page(self) -> None:
+        self._footer()
+        self.canvas.showPage()
+        self.page += 1
+        self.y = self.height - self.margin
+
+    def text(self, value: str, font: str = "Helvetica", size: float = 10, color: str = "#000000") -> None:
+        leading = size * 1.3
+        for line in simpleSplit(value, font, size, self.width - 2 * self.margin) or [""]:
+            if self.y - leading < self.margin:
+                self.new_page()
+            self.y -= leading
+            self.canvas.setFont(font, size)
+            self.canvas.setFillColor(color)
+            self.canvas.drawString(self.margin, self.y, line)
+
+    def gap(self, height: float = 0.15 * inch) -> None:
+        self.y -= height
+
+    def save(self) -> None:
+        self._footer()
+        self.canvas.save()
+
+def render_case_pdf_from_spool(case: Dict[str, Any], spool_path: str, path: str) -> None:
+    """
+    Render a case report to `path`. Queries are read one at a time from an
+    NDJSON spool of report snapshots and drawn straight onto the canvas;
+    the canvas itself still holds every page until it is saved.
+    """
+    writer = _CanvasWriter(path)
+    writer.text("OSINT Case Report", "Helvetica-Bold", 24, "#00aa00")
+    writer.gap()
+    writer.text(PDF_DISCLAIMER, "Helvetica-Bold", 10, "#ff0000")
+    writer.gap(0.3 * inch)
+    
+    writer.text(f"Case: {case['name']}", "Helvetica-Bold", 12)
+    if case.get("description"):
+        writer.text(f"Description: {case['description']}")
+    writer.text(f"Status: {case['status']}")
+    writer.text(f"Created At: {case['created_at']}")
+    writer.text(f"Queries: {case['query_count']}")
+    writer.gap(0.3 * inch)
+    
+    with open(spool_path) as spool:
+        for line in spool:
+            query = json.loads(line)
+            writer.text(
+                f"Query #{query['id']}: {query['query_type']} = {query['query_value']}",
+                "Helvetica-Bold", 12
+            )
+            writer.text(f"Risk Score: {query['risk_score']}    Created At: {query['created_at']}")
+            results = query["results"] if isinstance(query["results"], dict) else {}
+            for result in results.get("results", []):
+                source = result.get("source", "Unknown")
+                confidence = result.get("confidence", "N/A")
+                writer.text(f"- Source: {source} (Confidence: {confidence})", size=9)
+            writer.gap()
+    
+    writer.save()
 
@@ -0,0 +1,82 @@
+"""
+Report workers - bounded process pool for CPU-heavy report rendering
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+from app.services.report_generator import write_pdf_report, render_case_pdf_from_spool
+
+class RenderQueueFull(Exception):
+    """Raised when too many PDF renders are already running or waiting"""
+
+# Rendering happens in separate processes so a large document can neither
+# hold the GIL nor stall the event loop of the worker serving it
+_pdf_executor: Optional[ProcessPoolExecutor] = None
+_pdf_slots: Optional[asyncio.Semaphore] = None
+_pdf_pending = 0
+
+def _get_pdf_executor() -> ProcessPoolExecutor:
+    global _pdf_executor
+    if _pdf_executor is None:
+        # spawn: forking a process that runs an event loop and thread pools is unsafe
+        _pdf_executor = ProcessPoolExecutor(
+            max_workers=settings.PDF_RENDER_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pdf_executor
+
+def _get_pdf_slots() -> asyncio.Semaphore:
+    global _pdf_slots
+    if _pdf_slots is None:
+        _pdf_slots = asyncio.Semaphore(settings.PDF_RENDER_WORKERS)
+    return _pdf_slots
+
+async def _render(fn: Callable[..., None], *args: Any) -> None:
+    """
+    Run a PDF render function in the process pool. Renders beyond the
+    worker count wait their turn; beyond PDF_RENDER_MAX_QUEUED they are
+    refused with RenderQueueFull.
+    """
+    global _pdf_pending
+    if _pdf_pending >= settings.PDF_RENDER_WORKERS + settings.PDF_RENDER_MAX_QUEUED:
+        raise RenderQueueFull("PDF render queue is full")
+
+    _pdf_pending += 1
+    try:
+        async with _get_pdf_slots():
+            loop = asyncio.get_running_loop()
+            executor = _get_pdf_executor()
+            try:
+                await loop.run_in_executor(executor, fn, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. OOM-killed); start a fresh pool next time
+                _discard_executor(executor)
+                raise
+    finally:
+        _pdf_pending -= 1
+
+async def render_pdf(snapshot: Dict[str, Any], path: str) -> None:
+    """Render a single-query PDF report to `path`"""
+    await _render(write_pdf_report, snapshot, path)
+
+async def render_case_pdf(case: Dict[str, Any], spool_path: str, path: str) -> None:
+    """Render a case PDF report to `path` from an NDJSON spool of query snapshots"""
+    await _render(render_case_pdf_from_spool, case, spool_path, path)
+
+def _discard_executor(executor: ProcessPoolExecutor) -> None:
+    global _pdf_executor
+    if _pdf_executor is executor:
+        _pdf_executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def shutdown_report_workers() -> None:
+    """Stop the render pool, dropping renders that have not started"""
+    global _pdf_executor
+    if _pdf_executor is not None:
+        _pdf_executor.shutdown(wait=False, cancel_futures=True)
+        _pdf_executor = None
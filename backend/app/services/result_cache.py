@@ -0,0 +1,241 @@
+"""
+Result cache - TTL + LRU cache of per-module OSINT results
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.services.normalization import normalize_query_value
+
+CacheKey = Tuple[str, str, str]
+
+
+class _MemoryTier:
+    """In-process LRU bounded by the total size of the serialized entries"""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[CacheKey, Tuple[float, str]]" = OrderedDict()
+        self.evictions = 0
+
+    def get(self, key: CacheKey, now: float) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= now:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: CacheKey, payload: str, expires_at: float) -> None:
+        if len(payload) > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = (expires_at, payload)
+        self.size += len(payload)
+        while self.size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _SQLiteTier:
+    """Persistent tier; calls are blocking and run in a worker thread"""
+
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "module TEXT, query_type TEXT, query_value TEXT, "
+                "expires_at REAL, payload TEXT, "
+                "PRIMARY KEY (module, query_type, query_value))"
+            )
+            self._conn.commit()
+
+    def get(self, key: CacheKey, now: float) -> Optional[Tuple[float, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires_at, payload FROM result_cache "
+                "WHERE module = ? AND query_type = ? AND query_value = ?",
+                key
+            ).fetchone()
+        if row is None or row[0] <= now:
+            return None
+        return row
+
+    def set(self, key: CacheKey, payload: str, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO result_cache VALUES (?, ?, ?, ?, ?)",
+                (*key, expires_at, payload)
+            )
+            self._conn.commit()
+
+    def purge_expired(self, now: float) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM result_cache WHERE expires_at <= ?", (now,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM result_cache")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ResultCache:
+    """
+    Cache of module outputs keyed by (module, query_type, normalized value).
+    Empty results are "negative" entries and get their own, shorter TTL.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        default_ttl: int,
+        negative_ttl: int,
+        module_ttls: Optional[Dict[str, int]] = None,
+        sqlite_path: Optional[str] = None,
+        enabled: bool = True
+    ):
+        self.enabled = enabled
+        self.default_ttl = default_ttl
+        self.negative_ttl = negative_ttl
+        self.module_ttls = module_ttls or {}
+        self._memory = _MemoryTier(max_bytes)
+        self._sqlite_path = sqlite_path
+        self._sqlite: Optional[_SQLiteTier] = None
+        self._stats = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "stores": 0}
+
+    def _key(self, module: str, query_type: str, query_value: str) -> CacheKey:
+        return (module, query_type, normalize_query_value(query_type, query_value))
+
+    def _ttl(self, module: str, results: List[Dict[str, Any]]) -> int:
+        if not results:
+            return self.negative_ttl
+        return self.module_ttls.get(module, self.default_ttl)
+
+    def _persistent(self) -> Optional[_SQLiteTier]:
+        if self._sqlite is None and self._sqlite_path:
+            self._sqlite = _SQLiteTier(self._sqlite_path)
+        return self._sqlite
+
+    async def get(
+        self,
+        module: str,
+        query_type: str,
+        query_value: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return a cached result list, or None on a miss"""
+        if not self.enabled:
+            return None
+
+        key = self._key(module, query_type, query_value)
+        now = time.time()
+        payload = self._memory.get(key, now)
+        if payload is not None:
+            self._stats["memory_hits"] += 1
+            return json.loads(payload)
+
+        persistent = self._persistent()
+        if persistent is not None:
+            row = await asyncio.to_thread(persistent.get, key, now)
+            if row is not None:
+                expires_at, payload = row
+                self._memory.set(key, payload, expires_at)
+                self._stats["sqlite_hits"] += 1
+                return json.loads(payload)
+
+        self._stats["misses"] += 1
+        return None
+
+    async def set(
+        self,
+        module: str,
+        query_type: str,
+        query_value: str,
+        results: List[Dict[str, Any]]
+    ) -> None:
+        if not self.enabled:
+            return
+
+        ttl = self._ttl(module, results)
+        if ttl <= 0:
+            return
+
+        key = self._key(module, query_type, query_value)
+        payload = json.dumps(results, default=str)
+        expires_at = time.time() + ttl
+        self._memory.set(key, payload, expires_at)
+        self._stats["stores"] += 1
+
+        persistent = self._persistent()
+        if persistent is not None:
+            await asyncio.to_thread(persistent.set, key, payload, expires_at)
+
+    async def purge_expired(self) -> None:
+        persistent = self._persistent()
+        if persistent is not None:
+            await asyncio.to_thread(persistent.purge_expired, time.time())
+
+    async def clear(self) -> None:
+        self._memory.clear()
+        persistent = self._persistent()
+        if persistent is not None:
+            await asyncio.to_thread(persistent.clear)
+
+    def close(self) -> None:
+        if self._sqlite is not None:
+            self._sqlite.close()
+            self._sqlite = None
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self._stats["memory_hits"] + self._stats["sqlite_hits"]
+        lookups = hits + self._stats["misses"]
+        return {
+            **self._stats,
+            "hits": hits,
+            "hit_ratio": round(hits / lookups, 4) if lookups else 0.0,
+            "entries": len(self._memory),
+            "memory_bytes": self._memory.size,
+            "evictions": self._memory.evictions,
+            "persistent": self._sqlite_path is not None
+        }
+
+
+# Global instance
+result_cache = ResultCache(
+    max_bytes=settings.RESULT_CACHE_MAX_BYTES,
+    default_ttl=settings.RESULT_CACHE_DEFAULT_TTL,
+    negative_ttl=settings.RESULT_CACHE_NEGATIVE_TTL,
+    module_ttls=settings.RESULT_CACHE_TTLS,
+    sqlite_path=settings.RESULT_CACHE_SQLITE_PATH,
+    enabled=settings.RESULT_CACHE_ENABLED
+)
@@ -0,0 +1,114 @@
+"""
+Result filtering - fingerprint deduplication and placeholder removal
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+PLACEHOLDER_DROP = "drop"
+PLACEHOLDER_FLAG = "flag"
+
+# Boilerplate that differs between otherwise identical findings
+VOLATILE_DATA_KEYS = {"note", "disclaimer", "status"}
+
+CONFIDENCE_RANK = {"HIGH": 3, "MEDIUM": 2, "LOW": 1}
+
+def is_placeholder(result: Dict[str, Any]) -> bool:
+    """Simulated output from a module that has no real backend yet"""
+    if result.get("simulated") or result.get("placeholder"):
+        return True
+    # Rows stored before modules marked their simulations
+    data = result.get("data") if isinstance(result.get("data"), dict) else {}
+    return "simulat" in str(data.get("note", "")).lower()
+
+def is_low_signal(result: Dict[str, Any]) -> bool:
+    """Nothing to report: no link and no non-empty data fields"""
+    if result.get("url"):
+        return False
+    data = result.get("data") if isinstance(result.get("data"), dict) else {}
+    return not any(
+        value not in (None, "", [], {})
+        for key, value in data.items() if key not in VOLATILE_DATA_KEYS
+    )
+
+def fingerprint(result: Dict[str, Any]) -> str:
+    """
+    Stable identity of what a result says, independent of which module said
+    it: its URL when it has one, otherwise its canonicalized data.
+    """
+    url = result.get("url")
+    if isinstance(url, str) and url:
+        identity: Any = ["url", url.strip().rstrip("/").lower()]
+    else:
+        data = result.get("data") if isinstance(result.get("data"), dict) else {}
+        identity = ["data", {k: v for k, v in data.items() if k not in VOLATILE_DATA_KEYS}]
+    canonical = json.dumps(identity, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode()).hexdigest()
+
+def _provenance(result: Dict[str, Any]) -> Dict[str, Any]:
+    entry = {
+        "source": result.get("source"),
+        "confidence": result.get("confidence"),
+        "timestamp": result.get("timestamp")
+    }
+    data = result.get("data") if isinstance(result.get("data"), dict) else {}
+    if data.get("platform"):
+        entry["platform"] = data["platform"]
+    return entry
+
+def _rank(result: Dict[str, Any]) -> Tuple[int, int]:
+    data = result.get("data") if isinstance(result.get("data"), dict) else {}
+    return CONFIDENCE_RANK.get(str(result.get("confidence", "")).upper(), 0), len(data)
+
+def filter_results(
+    results: List[Dict[str, Any]],
+    placeholder_policy: Optional[str] = None,
+    drop_low_signal: Optional[bool] = None
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    One pass over collected results: drop (or flag) placeholders and
+    low-signal results, then merge results sharing a fingerprint into the
+    strongest one, recording every contributor under "provenance". Order of
+    first appearance is kept. Returns the results and a summary of counts.
+    """
+    policy = placeholder_policy or settings.OSINT_PLACEHOLDER_POLICY
+    if drop_low_signal is None:
+        drop_low_signal = settings.OSINT_DROP_LOW_SIGNAL
+
+    summary = {"input": len(results), "placeholders": 0, "low_signal": 0, "duplicates": 0, "output": 0}
+    kept: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        if not isinstance(result, dict):
+            continue
+        if is_placeholder(result):
+            summary["placeholders"] += 1
+            if policy == PLACEHOLDER_DROP:
+                continue
+            result = {**result, "placeholder": True}
+        elif drop_low_signal and is_low_signal(result):
+            summary["low_signal"] += 1
+            continue
+
+        key = fingerprint(result)
+        existing = kept.get(key)
+        if existing is None:
+            kept[key] = {**result, "fingerprint": key, "provenance": [_provenance(result)]}
+            continue
+
+        summary["duplicates"] += 1
+        provenance = existing["provenance"] + [_provenance(result)]
+        if _rank(result) > _rank(existing):
+            existing = {**result, "fingerprint": key}
+        # Replacing in place keeps the position of the first occurrence
+        kept[key] = {**existing, "provenance": provenance}
+
+    filtered = list(kept.values())
+    summary["output"] = len(filtered)
+    return filtered, summary
+
+def signal_results(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Results that should feed analysis (flagged placeholders excluded)"""
+    return [result for result in results if isinstance(result, dict) and not is_placeholder(result)]
@@ -0,0 +1,139 @@
+"""
+Timelines - per-query sorted event lists and case-wide k-way merging
+"""
+
+import heapq
+import logging
+from bisect import bisect_left
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Finding, OSINTQuery, QueryTimeline
+from app.services.findings import backfill_done, mark_backfill_done, reindex_queries
+
+logger = logging.getLogger(__name__)
+
+# Position of an event in a case timeline: (epoch_ms, query_id, index in query)
+EventKey = Tuple[int, int, int]
+
+def to_epoch_ms(value: datetime) -> int:
+    """Epoch milliseconds of a datetime; naive values are taken as UTC"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+def from_epoch_ms(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc).replace(tzinfo=None)
+
+def build_timeline(db_query: OSINTQuery, findings: Sequence[Finding]) -> List[QueryTimeline]:
+    """
+    The query's timeline row. Findings already carry parsed timestamps;
+    ones without a timestamp cannot be placed and are left out.
+    """
+    events = []
+    for finding in findings:
+        if finding.timestamp is None:
+            continue
+        data = finding.data if isinstance(finding.data, dict) else {}
+        events.append([
+            to_epoch_ms(finding.timestamp),
+            finding.source,
+            data.get("description") or "Activity detected",
+            finding.id
+        ])
+    # Stable, so simultaneous events keep their result order
+    events.sort(key=lambda event: event[0])
+    return [QueryTimeline(
+        query_id=db_query.id,
+        user_id=db_query.user_id,
+        case_id=db_query.case_id,
+        first_ts=events[0][0] if events else None,
+        last_ts=events[-1][0] if events else None,
+        events=events
+    )]
+
+async def backfill_timelines(db: AsyncSession, batch_size: int = 200) -> int:
+    """Build timelines for queries that have none yet, until it completes once. Returns the number processed."""
+    if await backfill_done(db, "timelines"):
+        return 0
+    processed = await reindex_queries(
+        db, ~exists().where(QueryTimeline.query_id == OSINTQuery.id), build_timeline, batch_size
+    )
+    await mark_backfill_done(db, "timelines")
+    if processed:
+        logger.info("Built timelines for %d queries", processed)
+    return processed
+
+def _events_from(
+    query_id: int,
+    events: List[list],
+    lower: Optional[int],
+    end: Optional[int],
+    after: Optional[EventKey]
+) -> Iterator[Tuple[EventKey, list]]:
+    first = bisect_left(events, lower, key=lambda event: event[0]) if lower is not None else 0
+    for index in range(first, len(events)):
+        event = events[index]
+        if end is not None and event[0] > end:
+            return
+        key = (event[0], query_id, index)
+        if after is not None and key <= after:
+            continue
+        yield key, event
+
+async def case_timeline(
+    db: AsyncSession,
+    case_id: int,
+    user_id: int,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    after: Optional[EventKey] = None,
+    limit: int = 100
+) -> Tuple[List[Dict[str, Any]], Optional[EventKey]]:
+    """
+    Events of the queries `user_id` filed in a case within [start, end],
+    oldest first, k-way merged from the stored per-query timelines. Resumes
+    strictly after `after`; returns the page and the key to resume from
+    (or None).
+    """
+    start_ms = to_epoch_ms(start) if start is not None else None
+    end_ms = to_epoch_ms(end) if end is not None else None
+    lower_ms = start_ms
+    if after is not None and (lower_ms is None or after[0] > lower_ms):
+        lower_ms = after[0]
+
+    conditions = [
+        QueryTimeline.case_id == case_id,
+        QueryTimeline.user_id == user_id,
+        QueryTimeline.first_ts.is_not(None)
+    ]
+    # Only timelines overlapping the window are loaded at all
+    if lower_ms is not None:
+        conditions.append(QueryTimeline.last_ts >= lower_ms)
+    if end_ms is not None:
+        conditions.append(QueryTimeline.first_ts <= end_ms)
+    rows = (await db.execute(
+        select(QueryTimeline.query_id, QueryTimeline.events).where(*conditions)
+    )).all()
+
+    merged = heapq.merge(*(
+        _events_from(row.query_id, row.events, lower_ms, end_ms, after) for row in rows
+    ))
+    page = list(islice(merged, limit + 1))
+
+    items = [
+        {
+            "timestamp": from_epoch_ms(event[0]),
+            "source": event[1],
+            "event": event[2],
+            "finding_id": event[3],
+            "query_id": key[1]
+        }
+        for key, event in page[:limit]
+    ]
+    next_key = page[limit - 1][0] if len(page) > limit else None
+    return items, next_key
@@ -0,0 +1,101 @@
+"""
+Login storm benchmark
+
+Fires a burst of concurrent logins at the API in-process while probing an
+unrelated cheap endpoint (/api/health) on a fixed interval, then reports
+login throughput and probe latency percentiles. With hashing on the event
+loop the probe p99 tracks the bcrypt cost; off-loop it should stay flat.
+
+Usage (from backend/):
+    python -m benchmarks.login_storm --logins 200 --concurrency 50 --rounds 12
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import List
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def summarize(name: str, samples: List[float]) -> str:
+    ms = [s * 1000 for s in samples]
+    return (
+        f"{name:<8} n={len(ms):<5} "
+        f"p50={percentile(ms, 50):8.2f}ms  p99={percentile(ms, 99):8.2f}ms  "
+        f"max={max(ms, default=0):8.2f}ms  mean={statistics.fmean(ms) if ms else 0:8.2f}ms"
+    )
+
+async def run(args: argparse.Namespace) -> None:
+    import httpx
+    import main
+
+    credentials = {"username": "bench", "email": "bench@example.com", "password": "bench-password"}
+    login_latencies: List[float] = []
+    probe_latencies: List[float] = []
+
+    async with main.lifespan(main.app):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.post("/api/auth/register", json=credentials)
+            response.raise_for_status()
+
+            storm_done = asyncio.Event()
+            slots = asyncio.Semaphore(args.concurrency)
+
+            async def login() -> None:
+                async with slots:
+                    started = time.perf_counter()
+                    response = await client.post("/api/auth/login", json=credentials)
+                    response.raise_for_status()
+                    login_latencies.append(time.perf_counter() - started)
+
+            async def probe() -> None:
+                while not storm_done.is_set():
+                    started = time.perf_counter()
+                    response = await client.get("/api/health")
+                    response.raise_for_status()
+                    probe_latencies.append(time.perf_counter() - started)
+                    await asyncio.sleep(args.probe_interval)
+
+            probe_task = asyncio.create_task(probe())
+            started = time.perf_counter()
+            await asyncio.gather(*(login() for _ in range(args.logins)))
+            elapsed = time.perf_counter() - started
+            storm_done.set()
+            await probe_task
+
+    print(f"bcrypt rounds={args.rounds} hash workers={args.workers} "
+          f"logins={args.logins} concurrency={args.concurrency}")
+    print(f"login throughput: {args.logins / elapsed:.1f} logins/s over {elapsed:.2f}s")
+    print(summarize("login", login_latencies))
+    print(summarize("health", probe_latencies))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=12, help="bcrypt cost factor")
+    parser.add_argument("--workers", type=int, default=4, help="password hashing threads")
+    parser.add_argument("--probe-interval", type=float, default=0.01, help="seconds between health probes")
+    args = parser.parse_args()
+
+    # Settings are read at import time, so configure before importing the app
+    db_path = os.path.join(tempfile.mkdtemp(prefix="login-storm-"), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
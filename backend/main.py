@@ -10,9 +10,18 @@ from contextlib import asynccontextmanager
 import os
 from dotenv import load_dotenv
 
-from app.database import engine, Base
+from app.database import engine, init_db, SessionLocal
 from app.routers import auth, osint, reports, cases
 from app.core.config import settings
+from app.services.http_client import create_http_client
+from app.services.osint_engine import osint_engine
+from app.services.modules import module_registry
+from app.services.result_cache import result_cache
+from app.services.job_queue import job_queue
+from app.services.report_workers import shutdown_report_workers
+from app.services.findings import backfill_findings
+from app.services.entity_index import backfill_entity_index
+from app.services.timelines import backfill_timelines
 
 load_dotenv()
 
@@ -20,9 +29,29 @@ load_dotenv()
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    Base.metadata.create_all(bind=engine)
+    await init_db()
+    if settings.FINDINGS_BACKFILL_ON_STARTUP:
+        async with SessionLocal() as db:
+            await backfill_findings(db)
+    if settings.ENTITY_INDEX_BACKFILL_ON_STARTUP:
+        async with SessionLocal() as db:
+            await backfill_entity_index(db)
+    if settings.TIMELINE_BACKFILL_ON_STARTUP:
+        async with SessionLocal() as db:
+            await backfill_timelines(db)
+    await result_cache.purge_expired()
+    http_client = create_http_client()
+    osint_engine.attach_http_client(http_client)
+    await job_queue.start()
     yield
     # Shutdown
+    await job_queue.stop()
+    osint_engine.attach_http_client(None)
+    await http_client.aclose()
+    module_registry.shutdown()
+    shutdown_report_workers()
+    result_cache.close()
+    await engine.dispose()
 
 app = FastAPI(
     title="OSINT Tool API",
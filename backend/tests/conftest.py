@@ -0,0 +1,88 @@
+"""
+Test fixtures - one app instance on a throwaway SQLite database
+"""
+
+import os
+import tempfile
+import uuid
+
+# Settings are read at import time, so point them at scratch space first
+_scratch = tempfile.mkdtemp(prefix="osint-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_scratch}/test.db"
+os.environ["REPORT_CACHE_DIR"] = os.path.join(_scratch, "report_cache")
+os.environ["RESULT_CACHE_ENABLED"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from app.database import SessionLocal
+from app.services.query_store import save_query
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+@pytest.fixture
+def run(client):
+    """Run a coroutine function on the app's event loop"""
+    def call(func, *args):
+        return client.portal.call(func, *args)
+    return call
+
+class User:
+    def __init__(self, client: TestClient, user_id: int, headers: dict):
+        self.client = client
+        self.id = user_id
+        self.headers = headers
+
+    def get(self, url: str, **kwargs):
+        return self.client.get(url, headers={**self.headers, **kwargs.pop("headers", {})}, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.client.post(url, headers={**self.headers, **kwargs.pop("headers", {})}, **kwargs)
+
+    def create_case(self, name: str = "case") -> int:
+        return self.post("/api/cases/", json={"name": name, "description": ""}).json()["id"]
+
+@pytest.fixture
+def make_user(client):
+    """Register a fresh user and return a client wrapper authenticated as them"""
+    def make() -> User:
+        name = f"user{uuid.uuid4().hex[:10]}"
+        credentials = {"username": name, "email": f"{name}@example.com", "password": "pw"}
+        client.post("/api/auth/register", json=credentials)
+        token = client.post("/api/auth/login", json=credentials).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+        user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+        return User(client, user_id, headers)
+    return make
+
+@pytest.fixture
+def user(make_user):
+    return make_user()
+
+@pytest.fixture
+def github_result():
+    """A GitHub finding linking a username to an email address"""
+    return {
+        "source": "github",
+        "data": {"username": "bob", "email": "bob@example.com"},
+        "url": "https://github.com/bob",
+        "confidence": "HIGH"
+    }
+
+@pytest.fixture
+def store(run):
+    """Persist an analysis result directly, as the engine's callers do"""
+    def save(user_id, query_value, results, case_id=None, query_type="username"):
+        async def _save():
+            async with SessionLocal() as db:
+                db_query = await save_query(
+                    db, user_id, query_type, query_value,
+                    {"results": results, "analysis": {}, "risk_score": "LOW"}, case_id=case_id
+                )
+                return db_query.id
+        return run(_save)
+    return save
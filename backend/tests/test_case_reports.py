@@ -0,0 +1,52 @@
+"""
+Case reports - consolidated JSON/PDF over a case's queries
+"""
+
+def test_case_json_covers_the_owner_queries_only(user, store, github_result):
+    case_id = user.create_case()
+    mine = [store(user.id, f"bob{i}", [github_result], case_id=case_id) for i in range(3)]
+    # Filed under the case id by someone else
+    store(user.id + 10_000, "intruder", [github_result], case_id=case_id)
+
+    report = user.get(f"/api/reports/case/{case_id}/json").json()
+    assert report["report_metadata"]["query_count"] == 3
+    assert [query["id"] for query in report["queries"]] == mine
+
+def test_case_report_is_rebuilt_when_a_query_is_edited(user, store, github_result):
+    case_id = user.create_case()
+    query_id = store(user.id, "bob", [github_result], case_id=case_id)
+    url = f"/api/reports/case/{case_id}/json"
+
+    etag = user.get(url).headers["etag"]
+    assert user.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    assert user.post(f"/api/osint/queries/{query_id}/correlate").status_code == 200
+    fresh = user.get(url, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert fresh.json()["queries"][0]["results"]["analysis"]["entity_counts"]["email"] == 1
+
+def test_case_report_is_rebuilt_when_a_query_is_added(user, store, github_result):
+    case_id = user.create_case()
+    store(user.id, "bob", [github_result], case_id=case_id)
+    url = f"/api/reports/case/{case_id}/json"
+
+    etag = user.get(url).headers["etag"]
+    store(user.id, "alice", [github_result], case_id=case_id)
+    fresh = user.get(url, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["report_metadata"]["query_count"] == 2
+
+def test_case_pdf(user, store, github_result):
+    case_id = user.create_case()
+    store(user.id, "bob", [github_result], case_id=case_id)
+
+    response = user.get(f"/api/reports/case/{case_id}/pdf")
+    assert response.status_code == 200
+    assert response.content.startswith(b"%PDF-")
+
+def test_other_users_cases_are_not_found(make_user):
+    owner, other = make_user(), make_user()
+    case_id = owner.create_case()
+    assert other.get(f"/api/reports/case/{case_id}/json").status_code == 404
+    assert other.get(f"/api/reports/case/{case_id}/pdf").status_code == 404
@@ -0,0 +1,136 @@
+"""
+Correlation - entity extraction, cross-source patterns and risk scoring
+"""
+
+import pytest
+
+from app.services.correlation import build_index, correlate, recorrelate
+
+WHOIS = {
+    "source": "whois",
+    "data": {
+        "domain": "example.com",
+        "registrar": "Example Registrar",
+        "name_servers": ["NS1.HOST.NET", "ns2.host.net."],
+        "status": ["clientTransferProhibited"]
+    },
+    "confidence": "HIGH",
+    "timestamp": "2024-01-03T00:00:00"
+}
+DNS = {
+    "source": "dns",
+    "data": {
+        "domain": "example.com",
+        "records": {"A": ["93.184.216.34"], "MX": ["10 mail.example.com."], "NS": ["ns1.host.net."]}
+    },
+    "confidence": "HIGH",
+    "timestamp": "2024-01-02T00:00:00"
+}
+GITHUB = {
+    "source": "github",
+    "data": {
+        "username": "bob",
+        "bio": "Write to bob.smith@example.org",
+        "profile_url": "https://github.com/bob",
+        "repos": [{"name": "tool", "owner": {"login": "bob-org"}}]
+    },
+    "confidence": "HIGH",
+    "timestamp": "2024-01-01T00:00:00",
+    "url": "https://github.com/bob"
+}
+SOCIAL = {
+    "source": "social_media",
+    "data": {"platform": "Twitter", "username": "Bob", "profile_url": "https://twitter.com/bob"},
+    "confidence": "MEDIUM",
+    "url": "https://twitter.com/bob"
+}
+BREACH = {
+    "source": "breach_database",
+    "data": {"email": "bob@example.com", "breaches_found": 2},
+    "confidence": "HIGH"
+}
+RESULTS = [WHOIS, DNS, GITHUB, SOCIAL, BREACH]
+
+def legacy_risk_score(results):
+    """Scoring before the entity index: top-level data fields only"""
+    emails = {r["data"]["email"] for r in results if "email" in r.get("data", {})}
+    domains = {r["data"]["domain"] for r in results if "domain" in r.get("data", {})}
+    factors = (len(results) > 10) + (len(emails) > 0) + (len(domains) > 1)
+    return "HIGH" if factors >= 2 else "MEDIUM" if factors == 1 else "LOW"
+
+def _values(index, entity_type):
+    return {value for kind, value in index.entities if kind == entity_type}
+
+def test_nested_fields_urls_and_records_are_extracted():
+    index = build_index(RESULTS)
+
+    assert _values(index, "domain") == {
+        "example.com", "ns1.host.net", "ns2.host.net", "mail.example.com",
+        "github.com", "twitter.com"
+    }
+    assert _values(index, "ip") == {"93.184.216.34"}
+    # Repo owners, and account names in profile URLs
+    assert _values(index, "username") == {"bob", "bob-org"}
+    assert _values(index, "email") == {"bob@example.com", "bob.smith@example.org"}
+    assert _values(index, "url") == {"https://github.com/bob", "https://twitter.com/bob"}
+
+def test_co_occurrence_is_counted_per_source():
+    index = build_index(RESULTS)
+
+    bob = index.entities[("username", "bob")]
+    assert bob.sources == {"github", "social_media"}
+    assert bob.origins == {"github", "social_media/Twitter"}
+    # Data fields and profile URLs, in both results
+    assert bob.occurrences == 6
+    assert index.entities[("domain", "ns1.host.net")].sources == {"whois", "dns"}
+
+def test_merged_duplicates_count_every_contributor():
+    merged = {**GITHUB, "provenance": [{"source": "github"}, {"source": "social_media", "platform": "GitHub"}]}
+    bob = build_index([merged]).entities[("username", "bob")]
+    assert bob.sources == {"github", "social_media"}
+    assert bob.origins == {"github", "social_media/GitHub"}
+
+def test_patterns():
+    analysis = correlate(RESULTS)
+    patterns = {pattern["type"]: [] for pattern in analysis["patterns"]}
+    for pattern in analysis["patterns"]:
+        patterns[pattern["type"]].append(pattern)
+
+    reuse, = patterns["username_reuse"]
+    assert reuse["usernames"] == ["bob"]
+    assert reuse["platforms"] == ["github", "social_media/Twitter"]
+
+    shared = {(pattern["entity_type"], pattern["value"]): pattern["sources"] for pattern in patterns["cross_source_entity"]}
+    assert shared[("domain", "example.com")] == ["dns", "whois"]
+    assert shared[("username", "bob")] == ["github", "social_media"]
+    # URLs are their own evidence, never a cross-source pattern
+    assert all(entity_type != "url" for entity_type, _ in shared)
+
+def test_timeline_is_sorted():
+    timeline = correlate(RESULTS)["timeline"]
+    assert [event["source"] for event in timeline] == ["github", "dns", "whois"]
+
+@pytest.mark.parametrize("results", [
+    RESULTS,
+    [WHOIS, DNS],
+    [GITHUB, SOCIAL],
+    [WHOIS, {**DNS, "data": {**DNS["data"], "domain": "example.net"}}],
+    [BREACH, WHOIS, {**DNS, "data": {**DNS["data"], "domain": "example.net"}}],
+    [SOCIAL] * 11,
+    []
+])
+def test_deeper_extraction_leaves_the_risk_score_unchanged(results):
+    assert correlate(results)["risk_score"] == legacy_risk_score(results)
+
+def test_recorrelate_keeps_filtering_and_skips_placeholders():
+    placeholder = {"source": "paste_sites", "data": {"email": "x@example.com"}, "placeholder": True}
+    blob = {
+        "results": [GITHUB, placeholder],
+        "analysis": {"filtering": {"input": 3, "placeholders": 1}},
+        "risk_score": "HIGH"
+    }
+
+    recorrelate(blob)
+    assert blob["analysis"]["filtering"] == {"input": 3, "placeholders": 1}
+    assert blob["analysis"]["total_findings"] == 1
+    assert blob["risk_score"] == "LOW"
@@ -0,0 +1,67 @@
+"""
+Upstream failures surface in the module status map
+"""
+
+import asyncio
+
+import httpx
+
+from app.services.modules import ModuleRegistry
+from app.services.osint_engine import MODULE_ERROR, MODULE_OK, MODULE_TIMEOUT, OSINTEngine
+
+def _analyze(handler, query_type, query_value):
+    async def scenario():
+        engine = OSINTEngine(ModuleRegistry())
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            engine.attach_http_client(client)
+            return await engine.analyze(query_type, query_value)
+    return asyncio.run(scenario())
+
+def _statuses(result):
+    return {name: module["status"] for name, module in result["modules"].items()}
+
+def test_unreachable_upstreams_are_timeouts_not_empty_answers():
+    def handler(request):
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    statuses = _statuses(_analyze(handler, "email", "bob@example.com"))
+    assert statuses["search"] == MODULE_TIMEOUT
+    assert statuses["breach"] == MODULE_TIMEOUT
+    # Simulated sources make no requests
+    assert statuses["paste"] == MODULE_OK
+    assert statuses["news"] == MODULE_OK
+
+def test_rate_limited_responses_are_errors():
+    def handler(request):
+        return httpx.Response(429, request=request)
+
+    result = _analyze(handler, "username", "bob")
+    statuses = _statuses(result)
+    assert statuses["search"] == MODULE_ERROR
+    assert statuses["github"] == MODULE_ERROR
+    assert "429" in result["modules"]["github"]["error"]
+    # Every platform answering 429 is a plain "not found" for each probe
+    assert statuses["social"] == MODULE_OK
+
+def test_social_fails_only_when_no_platform_answers():
+    def handler(request):
+        raise httpx.ConnectError("unreachable", request=request)
+
+    assert _statuses(_analyze(handler, "username", "bob"))["social"] == MODULE_ERROR
+
+    def flaky(request):
+        if request.url.host.endswith("github.com"):
+            raise httpx.ConnectError("unreachable", request=request)
+        return httpx.Response(404, request=request)
+
+    assert _statuses(_analyze(flaky, "username", "bob"))["social"] == MODULE_OK
+
+def test_definite_negative_answers_are_ok():
+    def handler(request):
+        return httpx.Response(404, request=request)
+
+    result = _analyze(handler, "username", "bob")
+    statuses = _statuses(result)
+    assert statuses["github"] == MODULE_OK
+    assert statuses["breach"] == MODULE_OK
+    assert result["modules"]["github"]["findings"] == 0
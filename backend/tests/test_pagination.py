@@ -0,0 +1,45 @@
+"""
+Keyset pagination of query history
+"""
+
+from datetime import datetime
+
+import pytest
+
+from app.services.pagination import InvalidCursor, decode_cursor, decode_token, encode_cursor, encode_token
+
+def test_cursor_round_trip():
+    created_at = datetime(2024, 5, 1, 12, 30, 15)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    assert decode_token(encode_token([1, 2, 3])) == [1, 2, 3]
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_token({"a": 1}), encode_token(["x"])])
+def test_malformed_cursors_are_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+def test_pages_cover_history_once_newest_first(user, store):
+    # Saved within the same second, so ordering falls back to the id
+    ids = [store(user.id, f"name{i}", []) for i in range(7)]
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 3, **({"cursor": cursor} if cursor else {})}
+        page = user.get("/api/osint/queries/summary", params=params).json()
+        seen += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+
+    assert seen == sorted(ids, reverse=True)
+
+def test_pages_only_show_own_queries(make_user, store):
+    owner, other = make_user(), make_user()
+    store(other.id, "theirs", [])
+    mine = store(owner.id, "mine", [])
+
+    page = owner.get("/api/osint/queries/summary").json()
+    assert [item["id"] for item in page["items"]] == [mine]
+
+def test_invalid_cursor_is_a_bad_request(user):
+    assert user.get("/api/osint/queries/summary", params={"cursor": "garbage"}).status_code == 400
@@ -0,0 +1,42 @@
+"""
+Per-host token buckets
+"""
+
+import asyncio
+
+import pytest
+
+from app.services.rate_limiter import RateLimiter, TokenBucket
+
+def test_burst_is_free_then_requests_are_spaced():
+    bucket = TokenBucket(rate=2, burst=2)
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.5, abs=0.01)
+    assert bucket.reserve() == pytest.approx(1.0, abs=0.01)
+
+def test_cancelled_waiters_return_their_tokens():
+    # The haveibeenpwned.com limits
+    bucket = TokenBucket(rate=0.16, burst=1)
+
+    async def scenario():
+        await bucket.acquire()
+        waiters = [asyncio.wait_for(bucket.acquire(), timeout=0.2) for _ in range(50)]
+        outcomes = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(outcome, asyncio.TimeoutError) for outcome in outcomes)
+
+    asyncio.run(scenario())
+    # Only the one token actually spent is still owed
+    assert bucket.reserve() <= 1 / 0.16
+
+def test_buckets_are_per_host_and_case_insensitive():
+    limiter = RateLimiter(default_rate=1, default_burst=1, host_limits={"slow.example": {"rate": 0.5, "burst": 3}})
+
+    async def scenario():
+        await limiter.acquire("Slow.Example")
+        await limiter.acquire("other.example")
+
+    asyncio.run(scenario())
+    assert set(limiter._buckets) == {"slow.example", "other.example"}
+    assert limiter._buckets["slow.example"].burst == 3
+    assert limiter._buckets["slow.example"].rate == 0.5
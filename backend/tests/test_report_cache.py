@@ -0,0 +1,124 @@
+"""
+Report cache - content-addressed storage, ETags and eviction
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.report_cache import ReportCache, etag_matches, report_key
+
+def test_report_key_tracks_content():
+    assert report_key("json", 1, {"a": 1}) == report_key("json", 1, {"a": 1})
+    assert report_key("json", 1, {"a": 1}) != report_key("json", 1, {"a": 2})
+    assert report_key("json", 1, {"a": 1}) != report_key("pdf", 1, {"a": 1})
+
+def test_etag_matching():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('W/"abc", "def"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches(None, '"abc"')
+    assert not etag_matches('"abd"', '"abc"')
+
+def test_put_get_and_etag_follow_content(tmp_path):
+    async def scenario():
+        cache = ReportCache(str(tmp_path), max_bytes=1 << 20)
+        first = await cache.put("k", b"one", ".json")
+        assert (await cache.get("k")) == first
+        second = await cache.put("k", b"two", ".json")
+        assert second.etag != first.etag
+        assert not os.path.exists(first.path)
+        assert await cache.get("missing") is None
+
+    asyncio.run(scenario())
+
+def test_least_recently_served_is_evicted(tmp_path):
+    async def scenario():
+        cache = ReportCache(str(tmp_path), max_bytes=25)
+        await cache.put("a", b"a" * 10, ".json")
+        await cache.put("b", b"b" * 10, ".json")
+        await cache.get("a")
+        await cache.put("c", b"c" * 10, ".json")
+        assert await cache.get("b") is None
+        assert await cache.get("a") is not None
+        assert await cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    asyncio.run(scenario())
+
+def test_concurrent_misses_render_once(tmp_path):
+    renders = 0
+
+    async def render(path):
+        nonlocal renders
+        renders += 1
+        await asyncio.sleep(0.05)
+        with open(path, "wb") as f:
+            f.write(b"report")
+
+    async def scenario():
+        cache = ReportCache(str(tmp_path), max_bytes=1 << 20)
+        reports = await asyncio.gather(*(cache.get_or_create("k", ".pdf", render) for _ in range(5)))
+        assert len({report.path for report in reports}) == 1
+
+    asyncio.run(scenario())
+    assert renders == 1
+
+def test_failed_render_leaves_nothing_behind(tmp_path):
+    async def render(path):
+        raise RuntimeError("boom")
+
+    async def scenario():
+        cache = ReportCache(str(tmp_path), max_bytes=1 << 20)
+        try:
+            await cache.get_or_create("k", ".pdf", render)
+        except RuntimeError:
+            pass
+        assert await cache.get("k") is None
+
+    asyncio.run(scenario())
+    assert os.listdir(tmp_path) == []
+
+def test_startup_sweeps_only_stale_temp_files(tmp_path):
+    # Another worker's render in progress, and one abandoned long ago
+    live = tmp_path / "tmplive.pdf"
+    stale = tmp_path / "tmpstale.pdf.spool"
+    live.write_bytes(b"partial")
+    stale.write_bytes(b"partial")
+    os.utime(stale, (time.time() - 7200, time.time() - 7200))
+
+    cache = ReportCache(str(tmp_path), max_bytes=1 << 20, stale_temp_age=3600)
+    assert asyncio.run(cache.get("k")) is None
+    assert live.exists()
+    assert not stale.exists()
+
+def test_query_report_revalidates_until_the_query_changes(user, store, github_result):
+    query_id = store(user.id, "bob", [github_result])
+    url = f"/api/reports/json/{query_id}"
+
+    etag = user.get(url).headers["etag"]
+    assert user.get(url).headers["etag"] == etag
+    assert user.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    # Re-correlation rewrites the stored analysis, so the old copy is stale
+    assert user.post(f"/api/osint/queries/{query_id}/correlate").status_code == 200
+    fresh = user.get(url, headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.json()["results"]["analysis"]["entity_counts"]["email"] == 1
+
+def test_concurrent_first_downloads_share_one_render(user, store, github_result):
+    query_id = store(user.id, "alice", [github_result])
+    url = f"/api/reports/json/{query_id}"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        responses = list(pool.map(lambda _: user.get(url), range(4)))
+
+    # Every render stamps its own generated_at, so one ETag means one render
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.headers["etag"] for response in responses}) == 1
+
+def test_reports_of_other_users_are_not_found(make_user, store, github_result):
+    owner, other = make_user(), make_user()
+    query_id = store(owner.id, "bob", [github_result])
+    assert other.get(f"/api/reports/json/{query_id}").status_code == 404
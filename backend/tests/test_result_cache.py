@@ -0,0 +1,92 @@
+"""
+Module result cache - TTL selection and what gets stored
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from app.services import osint_engine as engine_module
+from app.services.modules import ModuleRegistry, ModuleSpec
+from app.services.osint_engine import MODULE_ERROR, MODULE_OK, OSINTEngine
+from app.services.result_cache import ResultCache
+
+RESULT = [{"source": "flaky", "data": {"username": "bob"}, "confidence": "HIGH"}]
+
+outcomes = []
+
+async def flaky_module(query_type, query_value, client):
+    outcome = outcomes.pop(0)
+    if isinstance(outcome, Exception):
+        raise outcome
+    return outcome
+
+def _cache(**kwargs) -> ResultCache:
+    options = {"max_bytes": 1 << 20, "default_ttl": 3600, "negative_ttl": 600}
+    options.update(kwargs)
+    return ResultCache(**options)
+
+def test_ttl_depends_on_module_and_emptiness():
+    cache = _cache(module_ttls={"breach": 86400})
+    assert cache._ttl("breach", RESULT) == 86400
+    assert cache._ttl("search", RESULT) == 3600
+    # Negative entries expire sooner, whatever the module
+    assert cache._ttl("breach", []) == 600
+    assert cache._ttl("search", []) == 600
+
+def test_entries_expire_after_their_ttl():
+    cache = _cache(module_ttls={"github": 60})
+
+    async def scenario():
+        await cache.set("github", "username", "bob", RESULT)
+        await cache.set("breach", "email", "bob@example.com", [])
+        return (
+            await cache.get("github", "username", " BOB "),
+            cache._memory._entries[("github", "username", "bob")][0],
+            cache._memory._entries[("breach", "email", "bob@example.com")][0]
+        )
+
+    before = time.time()
+    hit, github_expiry, negative_expiry = asyncio.run(scenario())
+    assert hit == RESULT
+    assert github_expiry == pytest.approx(before + 60, abs=5)
+    assert negative_expiry == pytest.approx(before + 600, abs=5)
+
+def test_zero_ttl_is_not_stored():
+    cache = _cache(negative_ttl=0)
+    asyncio.run(cache.set("search", "username", "bob", []))
+    assert len(cache._memory) == 0
+
+@pytest.fixture
+def engine(monkeypatch):
+    cache = _cache()
+    monkeypatch.setattr(engine_module, "result_cache", cache)
+    outcomes.clear()
+    registry = ModuleRegistry(specs=(ModuleSpec("flaky", f"{__name__}:flaky_module"),), entry_point_group=None)
+    return OSINTEngine(registry), cache
+
+def _status(engine):
+    result = asyncio.run(engine.analyze("username", "bob"))
+    return result["modules"]["flaky"]
+
+def test_failed_runs_are_not_cached(engine):
+    engine, cache = engine
+    outcomes.extend([httpx.ConnectTimeout("timed out"), httpx.ConnectError("unreachable"), RESULT])
+
+    assert _status(engine)["status"] != MODULE_OK
+    assert _status(engine)["status"] == MODULE_ERROR
+    assert len(cache._memory) == 0
+
+    status = _status(engine)
+    assert status["status"] == MODULE_OK and "cached" not in status
+    assert _status(engine)["cached"] is True
+    assert outcomes == []
+
+def test_empty_successful_runs_are_cached(engine):
+    engine, cache = engine
+    outcomes.append([])
+
+    _status(engine)
+    assert _status(engine)["cached"] is True
@@ -0,0 +1,103 @@
+"""
+Result filtering - placeholder policy, fingerprint merging and provenance
+"""
+
+from app.services.result_filter import (
+    PLACEHOLDER_DROP,
+    PLACEHOLDER_FLAG,
+    filter_results,
+    fingerprint,
+    is_low_signal,
+    is_placeholder,
+    signal_results
+)
+
+PROFILE = {
+    "source": "social_media",
+    "data": {"platform": "GitHub", "username": "bob", "note": "Public check"},
+    "url": "https://github.com/bob",
+    "confidence": "MEDIUM",
+    "timestamp": "2024-01-01T00:00:00"
+}
+SIMULATED = {
+    "source": "news_forum",
+    "data": {"query": "bob", "note": "News and forum search simulation."},
+    "confidence": "LOW",
+    "simulated": True
+}
+
+def test_placeholders_are_recognized():
+    assert is_placeholder(SIMULATED)
+    # Rows stored before modules marked their simulations
+    assert is_placeholder({"data": {"note": "This is a simulated search result."}})
+    assert not is_placeholder(PROFILE)
+
+def test_low_signal_ignores_boilerplate():
+    assert is_low_signal({"data": {"note": "nothing", "status": "", "query": None}})
+    assert not is_low_signal({"data": {}, "url": "https://example.com"})
+    assert not is_low_signal({"data": {"breaches_found": 0}})
+
+def test_drop_policy_removes_placeholders():
+    results, summary = filter_results([PROFILE, SIMULATED], placeholder_policy=PLACEHOLDER_DROP)
+    assert [result["source"] for result in results] == ["social_media"]
+    assert summary["placeholders"] == 1
+
+def test_flag_policy_keeps_placeholders_out_of_analysis():
+    results, summary = filter_results([PROFILE, SIMULATED], placeholder_policy=PLACEHOLDER_FLAG)
+    assert [result.get("placeholder", False) for result in results] == [False, True]
+    assert summary["placeholders"] == 1
+    assert signal_results(results) == [results[0]]
+
+def test_same_url_merges_across_modules():
+    github = {
+        "source": "github",
+        "data": {"username": "bob", "name": "Bob", "public_repos": 3},
+        "url": "https://GitHub.com/bob/",
+        "confidence": "HIGH",
+        "timestamp": "2024-01-02T00:00:00"
+    }
+    results, summary = filter_results([PROFILE, github], placeholder_policy=PLACEHOLDER_DROP)
+
+    assert len(results) == 1
+    merged = results[0]
+    # The strongest duplicate wins, and every contributor is recorded
+    assert merged["source"] == "github"
+    assert merged["confidence"] == "HIGH"
+    assert [entry["source"] for entry in merged["provenance"]] == ["social_media", "github"]
+    assert merged["provenance"][0]["platform"] == "GitHub"
+    assert merged["fingerprint"] == fingerprint(PROFILE)
+    assert summary["duplicates"] == 1
+
+def test_without_url_data_decides_identity():
+    first = {"source": "a", "data": {"email": "bob@example.com", "note": "one"}, "confidence": "LOW"}
+    second = {"source": "b", "data": {"email": "bob@example.com", "note": "two"}, "confidence": "LOW"}
+    other = {"source": "c", "data": {"email": "alice@example.com"}, "confidence": "LOW"}
+
+    assert fingerprint(first) == fingerprint(second)
+    assert fingerprint(first) != fingerprint(other)
+    results, _ = filter_results([first, other, second], placeholder_policy=PLACEHOLDER_DROP)
+    # Equal rank keeps the first occurrence
+    assert [result["source"] for result in results] == ["a", "c"]
+    assert [entry["source"] for entry in results[0]["provenance"]] == ["a", "b"]
+
+def test_order_of_first_appearance_is_kept():
+    results = [
+        {"source": "x", "data": {"value": 1}, "url": "https://example.com/1", "confidence": "LOW"},
+        {"source": "y", "data": {"value": 2}, "url": "https://example.com/2", "confidence": "LOW"},
+        {"source": "z", "data": {"value": 1}, "url": "https://example.com/1", "confidence": "HIGH"}
+    ]
+    filtered, _ = filter_results(results, placeholder_policy=PLACEHOLDER_DROP)
+    # The stronger duplicate takes over the first occurrence's position
+    assert [result["source"] for result in filtered] == ["z", "y"]
+
+def test_summary_counts():
+    empty = {"source": "search_engine", "data": {"note": "nothing found"}, "confidence": "LOW"}
+    results = [PROFILE, dict(PROFILE), SIMULATED, empty, "not a result"]
+    filtered, summary = filter_results(results, placeholder_policy=PLACEHOLDER_DROP, drop_low_signal=True)
+
+    assert summary == {"input": 5, "placeholders": 1, "low_signal": 1, "duplicates": 1, "output": 1}
+    assert len(filtered) == summary["output"]
+
+    _, summary = filter_results(results, placeholder_policy=PLACEHOLDER_DROP, drop_low_signal=False)
+    assert summary["low_signal"] == 0
+    assert summary["output"] == 2
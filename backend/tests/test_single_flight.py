@@ -0,0 +1,150 @@
+"""
+Single-flight coalescing of identical in-flight analyses
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.core.config import settings
+from app.services.modules import ModuleRegistry, ModuleSpec
+from app.services.osint_engine import OSINTEngine, osint_engine
+
+calls = []
+cancelled = []
+
+async def slow_module(query_type, query_value, client):
+    calls.append(query_value)
+    try:
+        await asyncio.sleep(0.2)
+    except asyncio.CancelledError:
+        cancelled.append(query_value)
+        raise
+    return [{
+        "source": "slow",
+        "data": {"username": query_value.strip().lower()},
+        "url": f"https://example.com/{query_value.strip().lower()}",
+        "confidence": "HIGH"
+    }]
+
+async def quick_module(query_type, query_value, client):
+    return [{"source": "quick", "data": {"value": query_value}, "url": "https://example.com/quick", "confidence": "LOW"}]
+
+def _registry() -> ModuleRegistry:
+    return ModuleRegistry(specs=(
+        ModuleSpec("slow", f"{__name__}:slow_module"),
+        ModuleSpec("quick", f"{__name__}:quick_module"),
+    ), entry_point_group=None)
+
+@pytest.fixture(autouse=True)
+def reset_counters():
+    calls.clear()
+    cancelled.clear()
+
+@pytest.fixture
+def engine():
+    return OSINTEngine(_registry())
+
+def test_concurrent_identical_queries_share_one_run(engine):
+    async def scenario():
+        return await asyncio.gather(*(
+            engine.analyze("username", value) for value in ["Bob", "bob", " BOB "]
+        ))
+
+    results = asyncio.run(scenario())
+    assert calls == ["Bob"]
+    assert all(result is results[0] for result in results)
+    assert not engine._flights
+
+def test_different_indicators_run_separately(engine):
+    async def scenario():
+        await asyncio.gather(engine.analyze("username", "bob"), engine.analyze("username", "alice"))
+
+    asyncio.run(scenario())
+    assert sorted(calls) == ["alice", "bob"]
+
+def test_finished_runs_are_not_reused(engine):
+    async def scenario():
+        await engine.analyze("username", "bob")
+        await engine.analyze("username", "bob")
+
+    asyncio.run(scenario())
+    assert calls == ["bob", "bob"]
+
+def test_late_joiner_replays_earlier_events(engine):
+    async def collect():
+        return [event async for event in engine.analyze_stream("username", "bob")]
+
+    async def scenario():
+        first = asyncio.create_task(collect())
+        # Let the quick module finish before the second caller joins
+        await asyncio.sleep(0.1)
+        late = await collect()
+        return await first, late
+
+    first, late = asyncio.run(scenario())
+    assert calls == ["bob"]
+    assert [event["event"] for event in late] == [event["event"] for event in first]
+    assert [event.get("module") for event in late] == ["quick", "slow", None]
+
+def test_run_is_cancelled_when_every_caller_leaves(engine):
+    async def scenario():
+        stream = engine.analyze_stream("username", "bob")
+        first = await stream.__anext__()
+        # The client disconnects while the slow module is still running
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+        return first
+
+    first = asyncio.run(scenario())
+    assert first["module"] == "quick"
+    assert cancelled == ["bob"]
+    assert not engine._flights
+
+def test_run_survives_one_caller_leaving(engine):
+    async def scenario():
+        leaving = asyncio.create_task(engine.analyze("username", "bob"))
+        staying = asyncio.create_task(engine.analyze("username", "bob"))
+        await asyncio.sleep(0.05)
+        leaving.cancel()
+        return await staying
+
+    result = asyncio.run(scenario())
+    assert cancelled == []
+    assert result["modules"]["slow"]["status"] == "ok"
+
+def test_failure_reaches_every_caller(engine, monkeypatch):
+    def broken(*args):
+        raise ZeroDivisionError("analysis bug")
+    monkeypatch.setattr(engine, "_analyze_results", broken)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(engine.analyze("username", "bob") for _ in range(3)), return_exceptions=True
+        )
+
+    outcomes = asyncio.run(scenario())
+    assert calls == ["bob"]
+    assert all(isinstance(outcome, ZeroDivisionError) for outcome in outcomes)
+    assert not engine._flights
+
+def test_coalescing_can_be_disabled(engine, monkeypatch):
+    monkeypatch.setattr(settings, "OSINT_COALESCE_QUERIES", False)
+
+    async def scenario():
+        await asyncio.gather(engine.analyze("username", "bob"), engine.analyze("username", "bob"))
+
+    asyncio.run(scenario())
+    assert calls == ["bob", "bob"]
+
+def test_each_caller_saves_its_own_query(user, monkeypatch):
+    monkeypatch.setattr(osint_engine, "registry", _registry())
+    payload = {"query_type": "username", "query_value": "bob"}
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        responses = list(pool.map(lambda _: user.post("/api/osint/query", json=payload), range(3)))
+
+    assert calls == ["bob"]
+    assert all(response.status_code == 200 for response in responses)
+    assert len({response.json()["id"] for response in responses}) == 3
@@ -0,0 +1,90 @@
+"""
+Case timelines - k-way merge of stored per-query timelines
+"""
+
+import random
+from datetime import datetime
+
+from app.services.timelines import from_epoch_ms, to_epoch_ms
+
+def _result(source: str, description: str, timestamp: str) -> dict:
+    return {
+        "source": source,
+        "data": {"description": description, "username": description},
+        "url": f"https://example.com/{source}/{description}",
+        "timestamp": timestamp,
+        "confidence": "HIGH"
+    }
+
+def _seed_case(user, store, queries: int = 4, events: int = 25, seed: int = 7):
+    """Random, overlapping per-query timelines; returns every (query_id, timestamp)"""
+    rng = random.Random(seed)
+    case_id = user.create_case()
+    expected = []
+    for q in range(queries):
+        results, stamps = [], []
+        for i in range(events):
+            stamp = f"2024-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z"
+            results.append(_result(f"s{q}", f"e{q}-{i}", stamp))
+            stamps.append(stamp)
+        query_id = store(user.id, f"target{q}", results, case_id=case_id)
+        expected += [(query_id, stamp[:19]) for stamp in stamps]
+    return case_id, expected
+
+def _all_pages(user, case_id, limit, **params):
+    items, cursor, pages = [], None, 0
+    while True:
+        query = {"limit": limit, **params, **({"cursor": cursor} if cursor else {})}
+        page = user.get(f"/api/cases/{case_id}/timeline", params=query).json()
+        items += page["items"]
+        pages += 1
+        cursor = page["next_cursor"]
+        if not cursor:
+            return items, pages
+
+def test_epoch_round_trip():
+    moment = datetime(2024, 3, 5, 6, 7, 8, 123000)
+    assert from_epoch_ms(to_epoch_ms(moment)) == moment
+
+def test_merged_pages_are_ordered_and_complete(user, store):
+    case_id, expected = _seed_case(user, store)
+
+    items, pages = _all_pages(user, case_id, limit=7)
+
+    assert pages == -(-len(expected) // 7)
+    stamps = [item["timestamp"] for item in items]
+    assert stamps == sorted(stamps)
+    assert sorted((item["query_id"], item["timestamp"]) for item in items) == sorted(expected)
+    assert len({item["finding_id"] for item in items}) == len(expected)
+
+def test_window_limits_events(user, store):
+    case_id, expected = _seed_case(user, store, seed=11)
+    start, end = "2024-03-01T00:00:00", "2024-04-30T23:59:59"
+
+    items, _ = _all_pages(user, case_id, limit=5, start=start, end=end)
+
+    assert all(start <= item["timestamp"] <= end for item in items)
+    assert len(items) == sum(1 for _, stamp in expected if start <= stamp <= end)
+
+def test_identical_timestamps_page_without_gaps(user, store):
+    case_id = user.create_case()
+    for q in range(3):
+        store(user.id, f"same{q}", [_result(f"s{q}", f"e{q}-{i}", "2024-01-01T00:00:00Z") for i in range(4)], case_id=case_id)
+
+    items, _ = _all_pages(user, case_id, limit=5)
+    assert len({item["finding_id"] for item in items}) == 12
+
+def test_only_the_requesting_users_queries_are_merged(make_user, store):
+    owner = make_user()
+    case_id = owner.create_case()
+    store(owner.id, "mine", [_result("github", "mine", "2024-01-01T00:00:00Z")], case_id=case_id)
+    store(owner.id + 10_000, "theirs", [_result("github", "theirs", "2024-01-02T00:00:00Z")], case_id=case_id)
+
+    items, _ = _all_pages(owner, case_id, limit=10)
+    assert [item["event"] for item in items] == ["mine"]
+
+def test_bad_cursor_and_foreign_case(make_user):
+    owner, other = make_user(), make_user()
+    case_id = owner.create_case()
+    assert owner.get(f"/api/cases/{case_id}/timeline", params={"cursor": "garbage"}).status_code == 400
+    assert other.get(f"/api/cases/{case_id}/timeline").status_code == 404
@@ -4,7 +4,7 @@ import { useState, useEffect } from 'react'
 import api from '@/lib/api'
 import toast from 'react-hot-toast'
 import { format } from 'date-fns'
-import { FolderPlus, FolderOpen, Trash2 } from 'lucide-react'
+import { FolderPlus, FolderOpen, Trash2, Download } from 'lucide-react'
 
 export default function Cases() {
   const [cases, setCases] = useState<any[]>([])
@@ -18,7 +18,7 @@ export default function Cases() {
 
   const fetchCases = async () => {
     try {
-      const response = await api.get('/api/cases/')
+      const response = await api.get('/api/cases/summary')
       setCases(response.data)
     } catch (error) {
       toast.error('Failed to load cases')
@@ -52,6 +52,26 @@ export default function Cases() {
     }
   }
 
+  const downloadReport = async (caseId: number, reportFormat: 'json' | 'pdf') => {
+    try {
+      const response = await api.get(`/api/reports/case/${caseId}/${reportFormat}`, {
+        responseType: 'blob',
+      })
+      
+      const url = window.URL.createObjectURL(new Blob([response.data]))
+      const link = document.createElement('a')
+      link.href = url
+      link.setAttribute('download', `osint_case_report_${caseId}.${reportFormat}`)
+      document.body.appendChild(link)
+      link.click()
+      link.remove()
+      
+      toast.success(`Case report downloaded as ${reportFormat.toUpperCase()}`)
+    } catch (error) {
+      toast.error('Failed to download case report')
+    }
+  }
+
   if (loading) {
     return (
       <div className="cyber-card p-8 text-center">
@@ -144,16 +164,40 @@ export default function Cases() {
                   {caseItem.description && (
                     <p className="text-sm text-cyber-cyan mb-2">{caseItem.description}</p>
                   )}
+                  <div className="flex flex-wrap gap-3 text-xs text-cyber-cyan mb-2">
+                    <span>{caseItem.query_count} queries</span>
+                    <span>{caseItem.finding_count} findings</span>
+                    <span className="text-cyber-red">{caseItem.risk_counts.HIGH} high</span>
+                    <span className="text-cyber-yellow">{caseItem.risk_counts.MEDIUM} medium</span>
+                    <span className="text-cyber-green">{caseItem.risk_counts.LOW} low</span>
+                  </div>
                   <div className="text-xs text-cyber-cyan/70">
                     Created: {format(new Date(caseItem.created_at), 'PPp')}
+                    {' · '}Last activity: {format(new Date(caseItem.last_activity), 'PPp')}
                   </div>
                 </div>
-                <button
-                  onClick={() => handleDelete(caseItem.id)}
-                  className="p-2 text-cyber-red hover:bg-cyber-red/20 rounded transition-all"
-                >
-                  <Trash2 className="w-4 h-4" />
-                </button>
+                <div className="flex items-center gap-2">
+                  <button
+                    onClick={() => downloadReport(caseItem.id, 'json')}
+                    className="px-2 py-1 text-xs text-cyber-green border border-cyber-green/30 hover:bg-cyber-green/20 rounded transition-all flex items-center gap-1"
+                  >
+                    <Download className="w-3 h-3" />
+                    JSON
+                  </button>
+                  <button
+                    onClick={() => downloadReport(caseItem.id, 'pdf')}
+                    className="px-2 py-1 text-xs text-cyber-green border border-cyber-green/30 hover:bg-cyber-green/20 rounded transition-all flex items-center gap-1"
+                  >
+                    <Download className="w-3 h-3" />
+                    PDF
+                  </button>
+                  <button
+                    onClick={() => handleDelete(caseItem.id)}
+                    className="p-2 text-cyber-red hover:bg-cyber-red/20 rounded transition-all"
+                  >
+                    <Trash2 className="w-4 h-4" />
+                  </button>
+                </div>
               </div>
             </div>
           ))}
@@ -13,12 +13,21 @@ interface QueryHistoryProps {
 export default function QueryHistory({ onSelectQuery }: QueryHistoryProps) {
   const [queries, setQueries] = useState<any[]>([])
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
+
+  const fetchPage = async (cursor?: string) => {
+    const response = await api.get('/api/osint/queries/summary', {
+      params: cursor ? { cursor } : {},
+    })
+    setQueries((prev) => (cursor ? [...prev, ...response.data.items] : response.data.items))
+    setNextCursor(response.data.next_cursor)
+  }
 
   useEffect(() => {
     const fetchQueries = async () => {
       try {
-        const response = await api.get('/api/osint/queries')
-        setQueries(response.data)
+        await fetchPage()
       } catch (error) {
         toast.error('Failed to load query history')
       } finally {
@@ -28,6 +37,18 @@ export default function QueryHistory({ onSelectQuery }: QueryHistoryProps) {
     fetchQueries()
   }, [])
 
+  const loadMore = async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    try {
+      await fetchPage(nextCursor)
+    } catch (error) {
+      toast.error('Failed to load query history')
+    } finally {
+      setLoadingMore(false)
+    }
+  }
+
   const getRiskColor = (risk: string) => {
     switch (risk) {
       case 'HIGH':
@@ -84,6 +105,15 @@ export default function QueryHistory({ onSelectQuery }: QueryHistoryProps) {
               </div>
             </div>
           ))}
+          {nextCursor && (
+            <button
+              onClick={loadMore}
+              disabled={loadingMore}
+              className="w-full py-2 bg-cyber-green/20 border border-cyber-green/30 rounded hover:bg-cyber-green/30 transition-all disabled:opacity-50 disabled:cursor-not-allowed text-cyber-green"
+            >
+              {loadingMore ? 'Loading...' : 'Load more'}
+            </button>
+          )}
         </div>
       )}
     </div>